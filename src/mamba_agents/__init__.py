@@ -9,27 +9,39 @@ This framework provides:
 - Context window management with compaction strategies
 - Prompt template management with Jinja2
 - Comprehensive observability and error handling
+
+Public names are resolved lazily on first access, so ``import mamba_agents``
+does not pull in pydantic-ai, tiktoken, Jinja2 or the MCP client until the
+corresponding symbol is actually used.
 """
 
-from mamba_agents.agent.config import AgentConfig
-from mamba_agents.agent.core import Agent
-from mamba_agents.agent.result import AgentResult
-from mamba_agents.config.settings import AgentSettings
-from mamba_agents.context import ContextState
-from mamba_agents.context.compaction import CompactionResult
-from mamba_agents.context.config import CompactionConfig
-from mamba_agents.mcp import MCPAuthConfig, MCPClientManager, MCPServerConfig
-from mamba_agents.prompts import PromptConfig, PromptManager, PromptTemplate, TemplateConfig
-from mamba_agents.tokens.cost import CostBreakdown
-from mamba_agents.tokens.tracker import TokenUsage, UsageRecord
-from mamba_agents.workflows import (
-    Workflow,
-    WorkflowConfig,
-    WorkflowHooks,
-    WorkflowResult,
-    WorkflowState,
-    WorkflowStep,
-)
+from typing import TYPE_CHECKING
+
+from mamba_agents._internal.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from mamba_agents.agent.config import AgentConfig
+    from mamba_agents.agent.core import Agent
+    from mamba_agents.agent.result import AgentResult
+    from mamba_agents.config.settings import AgentSettings
+    from mamba_agents.context.compaction.base import CompactionResult
+    from mamba_agents.context.config import CompactionConfig
+    from mamba_agents.context.manager import ContextState
+    from mamba_agents.mcp.client import MCPClientManager
+    from mamba_agents.mcp.config import MCPAuthConfig, MCPServerConfig
+    from mamba_agents.prompts.config import PromptConfig, TemplateConfig
+    from mamba_agents.prompts.manager import PromptManager
+    from mamba_agents.prompts.template import PromptTemplate
+    from mamba_agents.tokens.cost import CostBreakdown
+    from mamba_agents.tokens.tracker import TokenUsage, UsageRecord
+    from mamba_agents.workflows.base import (
+        Workflow,
+        WorkflowResult,
+        WorkflowState,
+        WorkflowStep,
+    )
+    from mamba_agents.workflows.config import WorkflowConfig
+    from mamba_agents.workflows.hooks import WorkflowHooks
 
 __all__ = [
     # Core
@@ -63,4 +75,39 @@ __all__ = [
     "WorkflowStep",
 ]
 
+# Maps each public name to the module that defines it
+_LAZY_EXPORTS: dict[str, str] = {
+    # Core
+    "Agent": "mamba_agents.agent.core",
+    "AgentConfig": "mamba_agents.agent.config",
+    "AgentResult": "mamba_agents.agent.result",
+    "AgentSettings": "mamba_agents.config.settings",
+    # Context management
+    "CompactionConfig": "mamba_agents.context.config",
+    "CompactionResult": "mamba_agents.context.compaction.base",
+    "ContextState": "mamba_agents.context.manager",
+    # MCP integration
+    "MCPAuthConfig": "mamba_agents.mcp.config",
+    "MCPClientManager": "mamba_agents.mcp.client",
+    "MCPServerConfig": "mamba_agents.mcp.config",
+    # Prompt management
+    "PromptConfig": "mamba_agents.prompts.config",
+    "PromptManager": "mamba_agents.prompts.manager",
+    "PromptTemplate": "mamba_agents.prompts.template",
+    "TemplateConfig": "mamba_agents.prompts.config",
+    # Token tracking
+    "CostBreakdown": "mamba_agents.tokens.cost",
+    "TokenUsage": "mamba_agents.tokens.tracker",
+    "UsageRecord": "mamba_agents.tokens.tracker",
+    # Workflows
+    "Workflow": "mamba_agents.workflows.base",
+    "WorkflowConfig": "mamba_agents.workflows.config",
+    "WorkflowHooks": "mamba_agents.workflows.hooks",
+    "WorkflowResult": "mamba_agents.workflows.base",
+    "WorkflowState": "mamba_agents.workflows.base",
+    "WorkflowStep": "mamba_agents.workflows.base",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_EXPORTS)
+
 __version__ = "0.1.0"
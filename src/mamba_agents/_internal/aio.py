@@ -0,0 +1,73 @@
+"""Helpers for driving coroutines from synchronous code."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+    from typing import Any
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Get the current thread's event loop, creating and installing one if needed.
+
+    This mirrors the loop pydantic-ai's ``run_sync`` uses, so synchronous
+    follow-up work runs on the same long-lived loop instead of a fresh one.
+
+    Returns:
+        The thread's event loop.
+    """
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+    if loop.is_closed():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+    return loop
+
+
+@lru_cache(maxsize=1)
+def _loop_thread() -> ThreadPoolExecutor:
+    """Get the worker thread used when the calling thread's loop is running.
+
+    The worker keeps its own event loop, which is reused across calls.
+
+    Returns:
+        A single-thread executor.
+    """
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="mamba-agents-sync")
+
+
+def _run_on_thread_loop[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the current thread's shared event loop."""
+    return get_event_loop().run_until_complete(coro)
+
+
+def run_sync[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on the thread's shared event loop.
+
+    Unlike ``asyncio.run``, the loop is reused across calls rather than
+    created and torn down every time.
+
+    If the calling thread already has a running loop (e.g. in Jupyter or
+    inside a coroutine), the coroutine runs on a worker thread with its own
+    loop instead, and the caller blocks until it finishes. The running loop
+    is blocked for that time too.
+
+    Args:
+        coro: Coroutine to run.
+
+    Returns:
+        The coroutine's result.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return _run_on_thread_loop(coro)
+    return _loop_thread().submit(_run_on_thread_loop, coro).result()
@@ -0,0 +1,43 @@
+"""Lazy attribute loading for package namespaces (PEP 562)."""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def lazy_exports(
+    package: str,
+    namespace: dict[str, Any],
+    exports: Mapping[str, str],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build module-level ``__getattr__`` and ``__dir__`` for lazy re-exports.
+
+    Each exported name is imported from its defining module on first
+    attribute access and then cached in the package namespace, so later
+    lookups never reach ``__getattr__`` again.
+
+    Args:
+        package: Name of the package doing the re-export (its ``__name__``).
+        namespace: The package's ``globals()``.
+        exports: Mapping of exported name to the module that defines it.
+
+    Returns:
+        Tuple of ``(__getattr__, __dir__)`` to bind at package level.
+    """
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module_name = exports[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+
+        value = getattr(importlib.import_module(module_name), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*namespace, *exports})
+
+    return __getattr__, __dir__
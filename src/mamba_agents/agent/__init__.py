@@ -1,9 +1,17 @@
 """Core agent module."""
 
+from typing import TYPE_CHECKING
+
+from mamba_agents._internal.lazy import lazy_exports
 from mamba_agents.agent.config import AgentConfig
-from mamba_agents.agent.core import Agent
-from mamba_agents.agent.message_utils import dicts_to_model_messages, model_messages_to_dicts
-from mamba_agents.agent.result import AgentResult
+
+if TYPE_CHECKING:
+    from mamba_agents.agent.core import Agent
+    from mamba_agents.agent.message_utils import (
+        dicts_to_model_messages,
+        model_messages_to_dicts,
+    )
+    from mamba_agents.agent.result import AgentResult
 
 __all__ = [
     "Agent",
@@ -12,3 +20,12 @@ __all__ = [
     "dicts_to_model_messages",
     "model_messages_to_dicts",
 ]
+
+_LAZY_EXPORTS: dict[str, str] = {
+    "Agent": "mamba_agents.agent.core",
+    "AgentResult": "mamba_agents.agent.result",
+    "dicts_to_model_messages": "mamba_agents.agent.message_utils",
+    "model_messages_to_dicts": "mamba_agents.agent.message_utils",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_EXPORTS)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from mamba_agents.context.config import CompactionConfig
 from mamba_agents.prompts.config import TemplateConfig
@@ -19,8 +19,13 @@ class AgentConfig(BaseModel):
         tokenizer: Tokenizer configuration. None uses settings default.
         track_context: Whether to track messages internally across runs.
         auto_compact: Whether to automatically compact when threshold is reached.
+        track_usage: Whether to record token usage after each run.
     """
 
+    # Schema is built on first validation rather than at import; instances are
+    # immutable so an agent's config can be shared safely
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="forbid")
+
     max_iterations: int = Field(
         default=10,
         gt=0,
@@ -46,3 +51,7 @@ class AgentConfig(BaseModel):
         default=True,
         description="Auto-compact when threshold reached",
     )
+    track_usage: bool = Field(
+        default=True,
+        description="Record token usage after each run",
+    )
@@ -3,36 +3,82 @@
 from __future__ import annotations
 
 from collections.abc import AsyncIterator, Callable, Sequence
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
-from pydantic_ai import Agent as PydanticAgent
-from pydantic_ai.models import Model
-from pydantic_ai.toolsets import AbstractToolset
-
 from mamba_agents.agent.config import AgentConfig
-from mamba_agents.agent.message_utils import dicts_to_model_messages, model_messages_to_dicts
+from mamba_agents.agent.message_utils import (
+    dicts_to_model_messages,
+    iter_model_messages_as_dicts,
+)
 from mamba_agents.agent.result import AgentResult
 from mamba_agents.config.settings import AgentSettings
 from mamba_agents.context import ContextManager, ContextState
 from mamba_agents.context.compaction import CompactionResult
 from mamba_agents.prompts.config import TemplateConfig
 from mamba_agents.tokens import CostEstimator, TokenCounter, UsageTracker
+from mamba_agents.tokens.config import TokenizerConfig
 from mamba_agents.tokens.cost import CostBreakdown
 from mamba_agents.tokens.tracker import TokenUsage, UsageRecord
 
 if TYPE_CHECKING:
+    from pydantic_ai import Agent as PydanticAgent
     from pydantic_ai.messages import ModelMessage
+    from pydantic_ai.models import Model
+    from pydantic_ai.models.openai import OpenAIChatModel
+    from pydantic_ai.providers.openai import OpenAIProvider
     from pydantic_ai.result import StreamedRunResult
     from pydantic_ai.tools import ToolDefinition
+    from pydantic_ai.toolsets import AbstractToolset
     from pydantic_ai.usage import UsageLimits
 
     from mamba_agents.prompts import PromptManager
 
 
+_CONTEXT_DISABLED = "Context tracking is disabled. Enable with AgentConfig(track_context=True)"
+
 DepsT = TypeVar("DepsT")
 OutputT = TypeVar("OutputT")
 
 
+@lru_cache(maxsize=1)
+def _pydantic_agent_cls() -> type[PydanticAgent[Any, Any]]:
+    """Import pydantic-ai's Agent class on first use.
+
+    Returns:
+        The pydantic-ai Agent class.
+    """
+    from pydantic_ai import Agent as PydanticAgent
+
+    return PydanticAgent
+
+
+@lru_cache(maxsize=1)
+def _openai_classes() -> tuple[type[OpenAIChatModel], type[OpenAIProvider]]:
+    """Import the OpenAI model and provider classes on first use.
+
+    Returns:
+        Tuple of (OpenAIChatModel, OpenAIProvider).
+    """
+    from pydantic_ai.models.openai import OpenAIChatModel
+    from pydantic_ai.providers.openai import OpenAIProvider
+
+    return OpenAIChatModel, OpenAIProvider
+
+
+@lru_cache(maxsize=16)
+def _shared_token_counter(config_json: str) -> TokenCounter:
+    """Get a token counter shared by all agents with the same tokenizer config.
+
+    Args:
+        config_json: JSON dump of the TokenizerConfig, used as the cache key.
+
+    Returns:
+        TokenCounter for that configuration.
+    """
+    return TokenCounter(config=TokenizerConfig.model_validate_json(config_json))
+
+
 class Agent(Generic[DepsT, OutputT]):
     """AI Agent with tool-calling capabilities.
 
@@ -66,6 +112,21 @@ class Agent(Generic[DepsT, OutputT]):
         >>> print(result.output)
     """
 
+    __slots__ = (
+        "__weakref__",
+        "_agent",
+        "_config",
+        "_context_manager",
+        "_cost_estimator",
+        "_history_cache",
+        "_model_name",
+        "_prompt_manager",
+        "_resolved_system_prompt",
+        "_settings",
+        "_token_counter",
+        "_usage_tracker",
+    )
+
     def __init__(
         self,
         model: str | Model | None = None,
@@ -101,34 +162,22 @@ class Agent(Generic[DepsT, OutputT]):
         self._settings = settings or AgentSettings()
         self._prompt_manager = prompt_manager
 
-        # Determine model name and whether to use settings for connection config
+        # Resolve the model: settings supply connection config whenever given,
+        # bare strings are left to pydantic-ai's provider resolution, and a
+        # pre-built Model is used as-is
+        model_name: str | None
         if model is None:
             if settings is None:
                 raise ValueError("Either 'model' or 'settings' must be provided")
-            model_name: str | None = self._settings.model_backend.model
+            model_name = self._settings.model_backend.model
+            model = self._build_model_from_settings(self._settings, model_name)
         elif isinstance(model, str):
             model_name = model
+            if settings is not None:
+                model = self._build_model_from_settings(self._settings, model_name)
         else:
-            # model is already a Model instance
             model_name = None
 
-        # Construct model using settings connection config when applicable
-        if model_name is not None and settings is not None:
-            from pydantic_ai.models.openai import OpenAIChatModel
-            from pydantic_ai.providers.openai import OpenAIProvider
-
-            model = OpenAIChatModel(
-                model_name,
-                provider=OpenAIProvider(
-                    base_url=self._settings.model_backend.base_url,
-                    api_key=(
-                        self._settings.model_backend.api_key.get_secret_value()
-                        if self._settings.model_backend.api_key
-                        else None
-                    ),
-                ),
-            )
-
         # Resolve system prompt from template if needed
         self._resolved_system_prompt = self._resolve_system_prompt(self._config.system_prompt)
 
@@ -149,29 +198,42 @@ class Agent(Generic[DepsT, OutputT]):
         if output_type:
             agent_kwargs["output_type"] = output_type
 
-        self._agent: PydanticAgent[DepsT, OutputT] = PydanticAgent(model, **agent_kwargs)
+        self._agent: PydanticAgent[DepsT, OutputT] = _pydantic_agent_cls()(model, **agent_kwargs)
 
         # Store model name for cost estimation
         self._model_name = model_name
 
-        # Initialize token tracking (always on)
+        # Initialize token tracking (recording can be turned off via track_usage)
         tokenizer_cfg = self._config.tokenizer or self._settings.tokenizer
-        self._token_counter = TokenCounter(config=tokenizer_cfg)
-        self._usage_tracker = UsageTracker(cost_rates=self._settings.cost_rates)
+        if tokenizer_cfg.cache_tokenizer:
+            # Counters are stateless, so agents with identical configs share one
+            self._token_counter = _shared_token_counter(tokenizer_cfg.model_dump_json())
+        else:
+            self._token_counter = TokenCounter(config=tokenizer_cfg)
+        self._usage_tracker = UsageTracker(
+            cost_rates=self._settings.cost_rates,
+            enabled=self._config.track_usage,
+        )
         self._cost_estimator = CostEstimator(custom_rates=self._settings.cost_rates)
 
         # Initialize context manager (if enabled)
         if self._config.track_context:
             context_cfg = self._config.context or self._settings.context
+            # Without auto-compaction nothing reads token counts after each run,
+            # so tokenize lazily when they are first requested
             self._context_manager: ContextManager | None = ContextManager(
                 config=context_cfg,
                 token_counter=self._token_counter,
+                defer_tokenize=not self._config.auto_compact,
             )
             if self._resolved_system_prompt:
                 self._context_manager.set_system_prompt(self._resolved_system_prompt)
         else:
             self._context_manager = None
 
+        # Internal context converted to pydantic-ai messages, keyed by context version
+        self._history_cache: tuple[int, list[ModelMessage]] | None = None
+
     def _resolve_system_prompt(self, prompt: str | TemplateConfig) -> str:
         """Resolve a system prompt from string or template config.
 
@@ -203,6 +265,31 @@ class Agent(Generic[DepsT, OutputT]):
         self._prompt_manager = PromptManager(config=self._settings.prompts)
         return self._prompt_manager
 
+    @staticmethod
+    def _build_model_from_settings(
+        settings: AgentSettings,
+        model_name: str | None = None,
+    ) -> OpenAIChatModel:
+        """Build an OpenAI-compatible model from backend settings.
+
+        Args:
+            settings: Settings providing the backend connection config.
+            model_name: Model to use. Defaults to settings.model_backend.model.
+
+        Returns:
+            OpenAIChatModel connected to the configured backend.
+        """
+        model_cls, provider_cls = _openai_classes()
+        backend = settings.model_backend
+
+        return model_cls(
+            model_name or backend.model,
+            provider=provider_cls(
+                base_url=backend.base_url,
+                api_key=backend.get_api_key(),
+            ),
+        )
+
     @classmethod
     def from_settings(
         cls,
@@ -230,24 +317,8 @@ class Agent(Generic[DepsT, OutputT]):
         Returns:
             Configured Agent instance.
         """
-        # Use OpenAI provider with custom base_url from settings
-        from pydantic_ai.models.openai import OpenAIChatModel
-        from pydantic_ai.providers.openai import OpenAIProvider
-
-        model = OpenAIChatModel(
-            settings.model_backend.model,
-            provider=OpenAIProvider(
-                base_url=settings.model_backend.base_url,
-                api_key=(
-                    settings.model_backend.api_key.get_secret_value()
-                    if settings.model_backend.api_key
-                    else None
-                ),
-            ),
-        )
-
+        # The model is built from settings.model_backend in __init__
         return cls(
-            model,
             tools=tools,
             toolsets=toolsets,
             system_prompt=system_prompt,
@@ -256,23 +327,81 @@ class Agent(Generic[DepsT, OutputT]):
             settings=settings,
         )
 
-    async def _post_run_hook(self, result: AgentResult[OutputT]) -> None:
-        """Handle post-run tracking and context management.
+    def _require_context(self) -> ContextManager:
+        """Get the context manager, failing if context tracking is disabled.
+
+        Returns:
+            The agent's ContextManager.
+
+        Raises:
+            RuntimeError: If context tracking is disabled.
+        """
+        context_manager = self._context_manager
+        if context_manager is None:
+            raise RuntimeError(_CONTEXT_DISABLED)
+        return context_manager
+
+    def _resolve_history(
+        self,
+        message_history: list[ModelMessage] | None,
+    ) -> list[ModelMessage] | None:
+        """Resolve the message history to pass to pydantic-ai.
+
+        When no explicit history is given, the internal context is converted to
+        pydantic-ai messages. The converted list is cached against the context
+        manager's version so unchanged context is not converted again.
+
+        Args:
+            message_history: Optional explicit message history.
+
+        Returns:
+            Message history for the run, or None to start without history.
+        """
+        if message_history is not None:
+            # Explicit history provided - use it
+            return message_history
+
+        context_manager = self._context_manager
+        if context_manager is None or not context_manager.has_messages():
+            return None
+
+        # Use internal context (convert to pydantic-ai format)
+        version = context_manager.version
+        if self._history_cache is None or self._history_cache[0] != version:
+            converted = dicts_to_model_messages(context_manager.iter_messages())
+            self._history_cache = (version, converted)
+        return self._history_cache[1]
+
+    def _record_run(self, result: AgentResult[OutputT] | StreamedRunResult[DepsT, OutputT]) -> bool:
+        """Record usage and ingest new messages from a finished run.
+
+        New messages are converted, tokenized and checked against the
+        compaction threshold in a single pass over the run's messages.
 
         Args:
             result: The result from the run.
+
+        Returns:
+            True if the context should now be auto-compacted.
         """
-        # 1. Always record usage
-        self._usage_tracker.record_usage(result.usage(), model=self._model_name)
+        if self._usage_tracker.enabled:
+            self._usage_tracker.record_usage(result.usage(), model=self._model_name)
 
-        # 2. Track messages in context manager if enabled
-        if self._context_manager is not None:
-            new_messages = model_messages_to_dicts(result.new_messages())
-            self._context_manager.add_messages(new_messages)
+        if self._context_manager is None:
+            return False
+        return self._context_manager.ingest_and_check(
+            iter_model_messages_as_dicts(result.new_messages()),
+            self._config.auto_compact,
+        )
 
-            # 3. Auto-compact if enabled and threshold reached
-            if self._config.auto_compact and self._context_manager.should_compact():
-                await self._context_manager.compact()
+    async def _post_run_hook(self, result: AgentResult[OutputT]) -> None:
+        """Handle post-run tracking and context management.
+
+        Args:
+            result: The result from the run.
+        """
+        if self._record_run(result):
+            await self._require_context().compact()
 
     async def run(
         self,
@@ -294,23 +423,12 @@ class Agent(Generic[DepsT, OutputT]):
         Returns:
             AgentResult containing the output and metadata.
         """
-        kwargs: dict[str, Any] = {}
-        if deps is not None:
-            kwargs["deps"] = deps
-        if usage_limits is not None:
-            kwargs["usage_limits"] = usage_limits
-
-        # Determine message history to use
-        if message_history is not None:
-            # Explicit history provided - use it
-            kwargs["message_history"] = message_history
-        elif self._context_manager is not None:
-            # Use internal context (convert to pydantic-ai format)
-            internal_messages = self._context_manager.get_messages()
-            if internal_messages:
-                kwargs["message_history"] = dicts_to_model_messages(internal_messages)
-
-        result = await self._agent.run(prompt, **kwargs)
+        result = await self._agent.run(
+            prompt,
+            deps=deps,
+            message_history=self._resolve_history(message_history),
+            usage_limits=usage_limits,
+        )
         wrapped_result = AgentResult(result)
 
         # Post-run tracking
@@ -324,20 +442,8 @@ class Agent(Generic[DepsT, OutputT]):
         Args:
             result: The result from the run.
         """
-        # 1. Always record usage
-        self._usage_tracker.record_usage(result.usage(), model=self._model_name)
-
-        # 2. Track messages in context manager if enabled
-        if self._context_manager is not None:
-            new_messages = model_messages_to_dicts(result.new_messages())
-            self._context_manager.add_messages(new_messages)
-
-            # 3. Auto-compact if enabled and threshold reached
-            # Note: For sync version, we use asyncio.run for compaction
-            if self._config.auto_compact and self._context_manager.should_compact():
-                import asyncio
-
-                asyncio.run(self._context_manager.compact())
+        if self._record_run(result):
+            self._require_context().compact_sync()
 
     def run_sync(
         self,
@@ -359,23 +465,12 @@ class Agent(Generic[DepsT, OutputT]):
         Returns:
             AgentResult containing the output and metadata.
         """
-        kwargs: dict[str, Any] = {}
-        if deps is not None:
-            kwargs["deps"] = deps
-        if usage_limits is not None:
-            kwargs["usage_limits"] = usage_limits
-
-        # Determine message history to use
-        if message_history is not None:
-            # Explicit history provided - use it
-            kwargs["message_history"] = message_history
-        elif self._context_manager is not None:
-            # Use internal context (convert to pydantic-ai format)
-            internal_messages = self._context_manager.get_messages()
-            if internal_messages:
-                kwargs["message_history"] = dicts_to_model_messages(internal_messages)
-
-        result = self._agent.run_sync(prompt, **kwargs)
+        result = self._agent.run_sync(
+            prompt,
+            deps=deps,
+            message_history=self._resolve_history(message_history),
+            usage_limits=usage_limits,
+        )
         wrapped_result = AgentResult(result)
 
         # Post-run tracking
@@ -406,31 +501,16 @@ class Agent(Generic[DepsT, OutputT]):
         Note:
             Usage and context tracking occurs after the stream is consumed.
         """
-        kwargs: dict[str, Any] = {}
-        if deps is not None:
-            kwargs["deps"] = deps
-        if usage_limits is not None:
-            kwargs["usage_limits"] = usage_limits
-
-        # Determine message history to use
-        if message_history is not None:
-            # Explicit history provided - use it
-            kwargs["message_history"] = message_history
-        elif self._context_manager is not None:
-            # Use internal context (convert to pydantic-ai format)
-            internal_messages = self._context_manager.get_messages()
-            if internal_messages:
-                kwargs["message_history"] = dicts_to_model_messages(internal_messages)
-
-        async with self._agent.run_stream(prompt, **kwargs) as result:
+        async with self._agent.run_stream(
+            prompt,
+            deps=deps,
+            message_history=self._resolve_history(message_history),
+            usage_limits=usage_limits,
+        ) as result:
             yield result
             # After stream is consumed and yield returns, track usage and messages
-            self._usage_tracker.record_usage(result.usage(), model=self._model_name)
-            if self._context_manager is not None:
-                new_messages = model_messages_to_dicts(result.all_messages())
-                self._context_manager.add_messages(new_messages)
-                if self._config.auto_compact and self._context_manager.should_compact():
-                    await self._context_manager.compact()
+            if self._record_run(result):
+                await self._require_context().compact()
 
     def tool(
         self,
@@ -458,21 +538,13 @@ class Agent(Generic[DepsT, OutputT]):
             ... async def read_file(path: str) -> str:
             ...     return Path(path).read_text()
         """
-        kwargs: dict[str, Any] = {}
-        if name:
-            kwargs["name"] = name
-        if description:
-            kwargs["description"] = description
-        if retries is not None:
-            kwargs["retries"] = retries
-
-        if func is not None:
-            return self._agent.tool(**kwargs)(func)
-
-        def decorator(f: Callable[..., Any]) -> Callable[..., Any]:
-            return self._agent.tool(**kwargs)(f)
-
-        return decorator
+        # pydantic-ai registers func directly, or returns a decorator when func is None
+        return self._agent.tool(
+            func,
+            name=name or None,
+            description=description or None,
+            retries=retries,
+        )
 
     def tool_plain(
         self,
@@ -495,21 +567,13 @@ class Agent(Generic[DepsT, OutputT]):
         Returns:
             The decorated function.
         """
-        kwargs: dict[str, Any] = {}
-        if name:
-            kwargs["name"] = name
-        if description:
-            kwargs["description"] = description
-        if retries is not None:
-            kwargs["retries"] = retries
-
-        if func is not None:
-            return self._agent.tool_plain(**kwargs)(func)
-
-        def decorator(f: Callable[..., Any]) -> Callable[..., Any]:
-            return self._agent.tool_plain(**kwargs)(f)
-
-        return decorator
+        # pydantic-ai registers func directly, or returns a decorator when func is None
+        return self._agent.tool_plain(
+            func,
+            name=name or None,
+            description=description or None,
+            retries=retries,
+        )
 
     def override(
         self,
@@ -640,11 +704,7 @@ class Agent(Generic[DepsT, OutputT]):
         if text is not None:
             return self._token_counter.count(text)
 
-        if self._context_manager is None:
-            raise RuntimeError(
-                "Context tracking is disabled. Enable with AgentConfig(track_context=True)"
-            )
-        return self._context_manager.get_token_count()
+        return self._require_context().get_token_count()
 
     # === Usage Tracking Facade Methods ===
 
@@ -675,9 +735,7 @@ class Agent(Generic[DepsT, OutputT]):
         Returns:
             Estimated cost in USD.
         """
-        usage = self._usage_tracker.get_total_usage()
-        model_for_cost = model or self._model_name or "default"
-        return self._cost_estimator.estimate(usage, model_for_cost).total_cost
+        return self.get_cost_breakdown(model).total_cost
 
     def get_cost_breakdown(self, model: str | None = None) -> CostBreakdown:
         """Get detailed cost breakdown.
@@ -703,11 +761,7 @@ class Agent(Generic[DepsT, OutputT]):
         Raises:
             RuntimeError: If context tracking is disabled.
         """
-        if self._context_manager is None:
-            raise RuntimeError(
-                "Context tracking is disabled. Enable with AgentConfig(track_context=True)"
-            )
-        return self._context_manager.get_messages()
+        return self._require_context().get_messages()
 
     def should_compact(self) -> bool:
         """Check if context compaction threshold is reached.
@@ -718,11 +772,7 @@ class Agent(Generic[DepsT, OutputT]):
         Raises:
             RuntimeError: If context tracking is disabled.
         """
-        if self._context_manager is None:
-            raise RuntimeError(
-                "Context tracking is disabled. Enable with AgentConfig(track_context=True)"
-            )
-        return self._context_manager.should_compact()
+        return self._require_context().should_compact()
 
     async def compact(self) -> CompactionResult:
         """Manually trigger context compaction.
@@ -733,11 +783,7 @@ class Agent(Generic[DepsT, OutputT]):
         Raises:
             RuntimeError: If context tracking is disabled.
         """
-        if self._context_manager is None:
-            raise RuntimeError(
-                "Context tracking is disabled. Enable with AgentConfig(track_context=True)"
-            )
-        return await self._context_manager.compact()
+        return await self._require_context().compact()
 
     def get_context_state(self) -> ContextState:
         """Get the current context state.
@@ -748,11 +794,7 @@ class Agent(Generic[DepsT, OutputT]):
         Raises:
             RuntimeError: If context tracking is disabled.
         """
-        if self._context_manager is None:
-            raise RuntimeError(
-                "Context tracking is disabled. Enable with AgentConfig(track_context=True)"
-            )
-        return self._context_manager.get_context_state()
+        return self._require_context().get_context_state()
 
     # === Reset Operations ===
 
@@ -762,11 +804,7 @@ class Agent(Generic[DepsT, OutputT]):
         Raises:
             RuntimeError: If context tracking is disabled.
         """
-        if self._context_manager is None:
-            raise RuntimeError(
-                "Context tracking is disabled. Enable with AgentConfig(track_context=True)"
-            )
-        self._context_manager.clear()
+        self._require_context().clear()
 
     def reset_tracking(self) -> None:
         """Reset usage tracking data (keeps context)."""
@@ -5,11 +5,108 @@ Converts between pydantic-ai ModelMessage format and dict format for ContextMana
 
 from __future__ import annotations
 
-import json
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
+from pydantic_core import from_json
+
 if TYPE_CHECKING:
-    from pydantic_ai.messages import ModelMessage
+    from collections.abc import Callable, Iterable, Iterator
+
+    from pydantic_ai.messages import (
+        ModelMessage,
+        ModelRequest,
+        ModelResponse,
+        SystemPromptPart,
+        TextPart,
+        ToolCallPart,
+        ToolReturnPart,
+        UserPromptPart,
+    )
+
+
+def _system_prompt_part_to_dict(part: SystemPromptPart) -> dict[str, Any]:
+    """Convert a SystemPromptPart to a system message."""
+    return {
+        "role": "system",
+        "content": part.content,
+    }
+
+
+def _user_prompt_part_to_dict(part: UserPromptPart) -> dict[str, Any]:
+    """Convert a UserPromptPart to a user message."""
+    return {
+        "role": "user",
+        "content": part.content,
+    }
+
+
+def _tool_return_part_to_dict(part: ToolReturnPart) -> dict[str, Any]:
+    """Convert a ToolReturnPart to a tool message."""
+    return {
+        "role": "tool",
+        "tool_call_id": part.tool_call_id,
+        "name": part.tool_name,
+        "content": str(part.content),
+    }
+
+
+def _tool_call_part_to_dict(part: ToolCallPart) -> dict[str, Any]:
+    """Convert a ToolCallPart to an OpenAI-style tool call entry."""
+    return {
+        "id": part.tool_call_id,
+        "type": "function",
+        "function": {
+            "name": part.tool_name,
+            # Serialized by pydantic-core's native encoder; string
+            # args pass through unchanged and empty args become "{}"
+            "arguments": part.args_as_json_str(),
+        },
+    }
+
+
+@lru_cache(maxsize=1)
+def _message_classes() -> tuple[
+    type[ModelRequest], type[ModelResponse], type[TextPart], type[ToolCallPart]
+]:
+    """Import the pydantic-ai message classes used for dispatch on first use.
+
+    Returns:
+        Tuple of (ModelRequest, ModelResponse, TextPart, ToolCallPart).
+    """
+    from pydantic_ai.messages import ModelRequest, ModelResponse, TextPart, ToolCallPart
+
+    return ModelRequest, ModelResponse, TextPart, ToolCallPart
+
+
+@lru_cache(maxsize=1)
+def _request_part_classes() -> tuple[
+    type[SystemPromptPart], type[UserPromptPart], type[ToolReturnPart]
+]:
+    """Import the pydantic-ai ModelRequest part classes on first use.
+
+    Returns:
+        Tuple of (SystemPromptPart, UserPromptPart, ToolReturnPart).
+    """
+    from pydantic_ai.messages import SystemPromptPart, ToolReturnPart, UserPromptPart
+
+    return SystemPromptPart, UserPromptPart, ToolReturnPart
+
+
+@lru_cache(maxsize=1)
+def _request_part_converters() -> dict[type, Callable[[Any], dict[str, Any]]]:
+    """Map each supported ModelRequest part class to its dict converter.
+
+    Returns:
+        Dictionary of part class to converter function.
+    """
+    SystemPromptPart, UserPromptPart, ToolReturnPart = _request_part_classes()
+
+    return {
+        SystemPromptPart: _system_prompt_part_to_dict,
+        UserPromptPart: _user_prompt_part_to_dict,
+        ToolReturnPart: _tool_return_part_to_dict,
+    }
 
 
 def model_messages_to_dicts(messages: list[ModelMessage]) -> list[dict[str, Any]]:
@@ -21,87 +118,82 @@ def model_messages_to_dicts(messages: list[ModelMessage]) -> list[dict[str, Any]
     Returns:
         List of message dictionaries with role and content, compatible with ContextManager.
     """
-    result: list[dict[str, Any]] = []
+    return list(iter_model_messages_as_dicts(messages))
+
+
+def iter_model_messages_as_dicts(messages: Iterable[ModelMessage]) -> Iterator[dict[str, Any]]:
+    """Lazily convert pydantic-ai ModelMessage objects to dict format.
+
+    Yields the same dictionaries as model_messages_to_dicts() one at a time,
+    so callers can consume them without building an intermediate list.
+
+    Args:
+        messages: ModelRequest/ModelResponse objects from pydantic-ai.
+
+    Yields:
+        Message dictionaries with role and content, compatible with ContextManager.
+    """
+    model_request, model_response, text_part, tool_call_part = _message_classes()
+    get_request_converter = _request_part_converters().get
+    # One-slot cache of the last request part type and its converter; parts
+    # often repeat a type (e.g. several tool returns), skipping the dict lookup
+    last_part_type: type | None = None
+    convert: Callable[[Any], dict[str, Any]] | None = None
 
     for msg in messages:
-        msg_type = type(msg).__name__
+        msg_type = type(msg)
 
-        if msg_type == "ModelRequest":
+        if msg_type is model_request:
             # ModelRequest contains user prompts, system prompts, and tool returns
-            for part in getattr(msg, "parts", []):
-                part_type = type(part).__name__
-
-                if part_type == "SystemPromptPart":
-                    result.append(
-                        {
-                            "role": "system",
-                            "content": getattr(part, "content", ""),
-                        }
-                    )
-                elif part_type == "UserPromptPart":
-                    result.append(
-                        {
-                            "role": "user",
-                            "content": getattr(part, "content", ""),
-                        }
-                    )
-                elif part_type == "ToolReturnPart":
-                    result.append(
-                        {
-                            "role": "tool",
-                            "tool_call_id": getattr(part, "tool_call_id", ""),
-                            "name": getattr(part, "tool_name", ""),
-                            "content": str(getattr(part, "content", "")),
-                        }
-                    )
-
-        elif msg_type == "ModelResponse":
+            for part in msg.parts:
+                part_type = type(part)
+                if part_type is not last_part_type:
+                    last_part_type = part_type
+                    convert = get_request_converter(part_type)
+                if convert is not None:
+                    yield convert(part)
+
+        elif msg_type is model_response:
             # ModelResponse contains assistant text and tool calls
-            text_parts: list[str] = []
-            tool_calls: list[dict[str, Any]] = []
-
-            for part in getattr(msg, "parts", []):
-                part_type = type(part).__name__
-
-                if part_type == "TextPart":
-                    text_parts.append(getattr(part, "content", ""))
-                elif part_type == "ToolCallPart":
-                    args = getattr(part, "args", {})
-                    # Convert args to JSON string if it's a dict
-                    if isinstance(args, dict):
-                        args_str = json.dumps(args)
+            # Most responses have a single text part, so a list is only
+            # allocated once a second one is seen
+            text: str | None = None
+            text_parts: list[str] | None = None
+            # Only allocated for responses that actually call tools
+            tool_calls: list[dict[str, Any]] | None = None
+
+            for part in msg.parts:
+                part_type = type(part)
+
+                if part_type is text_part:
+                    if text is None:
+                        text = part.content
                     else:
-                        args_str = str(args)
-
-                    tool_calls.append(
-                        {
-                            "id": getattr(part, "tool_call_id", ""),
-                            "type": "function",
-                            "function": {
-                                "name": getattr(part, "tool_name", ""),
-                                "arguments": args_str,
-                            },
-                        }
-                    )
+                        if text_parts is None:
+                            text_parts = [text]
+                        text_parts.append(part.content)
+                elif part_type is tool_call_part:
+                    if tool_calls is None:
+                        tool_calls = []
+                    tool_calls.append(_tool_call_part_to_dict(part))
 
             # Create assistant message
             assistant_msg: dict[str, Any] = {
                 "role": "assistant",
-                "content": " ".join(text_parts) if text_parts else "",
+                "content": " ".join(text_parts) if text_parts is not None else text or "",
             }
             if tool_calls:
                 assistant_msg["tool_calls"] = tool_calls
 
-            result.append(assistant_msg)
-
-    return result
+            yield assistant_msg
 
 
-def dicts_to_model_messages(messages: list[dict[str, Any]]) -> list[ModelMessage]:
+def dicts_to_model_messages(messages: Iterable[dict[str, Any]]) -> list[ModelMessage]:
     """Convert dict format messages to pydantic-ai ModelMessage format.
 
     Args:
-        messages: List of message dictionaries with role and content.
+        messages: Message dictionaries with role and content. Any iterable is
+            accepted and consumed in a single pass.
 
     Returns:
         List of ModelRequest/ModelResponse objects suitable for pydantic-ai message_history.
@@ -110,37 +202,28 @@ def dicts_to_model_messages(messages: list[dict[str, Any]]) -> list[ModelMessage
         This creates a representation compatible with pydantic-ai's expected format.
         Complex tool call scenarios may require additional handling.
     """
-    from pydantic_ai.messages import (
-        ModelRequest,
-        ModelResponse,
-        SystemPromptPart,
-        TextPart,
-        ToolCallPart,
-        ToolReturnPart,
-        UserPromptPart,
-    )
+    ModelRequest, ModelResponse, TextPart, ToolCallPart = _message_classes()
+    SystemPromptPart, UserPromptPart, ToolReturnPart = _request_part_classes()
 
+    # Hot-loop callables bound to locals to avoid repeated global/attribute lookups
+    loads = from_json
     result: list[ModelMessage] = []
+    append_message = result.append
     current_request_parts: list[Any] = []
 
     for msg in messages:
-        role = msg.get("role", "")
-        content = msg.get("content", "")
-
-        if role == "system":
-            current_request_parts.append(SystemPromptPart(content=content))
-
-        elif role == "user":
-            current_request_parts.append(UserPromptPart(content=content))
-            # Flush as request after user message
-            if current_request_parts:
-                result.append(ModelRequest(parts=current_request_parts))
-                current_request_parts = []
-
-        elif role == "assistant":
+        try:
+            role = msg["role"]
+        except KeyError:
+            # Messages without a role carry nothing to convert
+            continue
+        content = msg.get("content") or ""
+
+        # Branches are ordered by how often each role occurs in a history
+        if role == "assistant":
             # Flush any pending request parts
             if current_request_parts:
-                result.append(ModelRequest(parts=current_request_parts))
+                append_message(ModelRequest(parts=current_request_parts))
                 current_request_parts = []
 
             # Build response parts
@@ -150,13 +233,12 @@ def dicts_to_model_messages(messages: list[dict[str, Any]]) -> list[ModelMessage
                 response_parts.append(TextPart(content=content))
 
             # Handle tool calls if present
-            tool_calls = msg.get("tool_calls", [])
-            for tool_call in tool_calls:
+            for tool_call in msg.get("tool_calls") or ():
                 func = tool_call.get("function", {})
                 args_str = func.get("arguments", "{}")
                 try:
-                    args = json.loads(args_str)
-                except json.JSONDecodeError:
+                    args = loads(args_str)
+                except ValueError:
                     args = {}
 
                 response_parts.append(
@@ -168,7 +250,13 @@ def dicts_to_model_messages(messages: list[dict[str, Any]]) -> list[ModelMessage
                 )
 
             if response_parts:
-                result.append(ModelResponse(parts=response_parts))
+                append_message(ModelResponse(parts=response_parts))
+
+        elif role == "user":
+            current_request_parts.append(UserPromptPart(content=content))
+            # Flush as request after user message
+            append_message(ModelRequest(parts=current_request_parts))
+            current_request_parts = []
 
         elif role == "tool":
             # Tool return goes into a request
@@ -180,8 +268,11 @@ def dicts_to_model_messages(messages: list[dict[str, Any]]) -> list[ModelMessage
                 )
             )
 
+        elif role == "system":
+            current_request_parts.append(SystemPromptPart(content=content))
+
     # Flush any remaining request parts
     if current_request_parts:
-        result.append(ModelRequest(parts=current_request_parts))
+        append_message(ModelRequest(parts=current_request_parts))
 
     return result
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 if TYPE_CHECKING:
@@ -13,18 +13,21 @@ if TYPE_CHECKING:
 T = TypeVar("T")
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentResult(Generic[T]):
     """Wrapper for agent run results with additional metadata.
 
     Provides convenient access to the result output, message history,
-    and usage statistics.
+    and usage statistics. Usage and new messages are computed once and
+    reused on subsequent calls.
 
     Attributes:
         _result: The underlying pydantic-ai RunResult.
     """
 
     _result: RunResult[T]
+    _usage: Usage | None = field(default=None, init=False, repr=False, compare=False)
+    _new_messages: list[Any] | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def output(self) -> T:
@@ -50,7 +53,9 @@ class AgentResult(Generic[T]):
         Returns:
             Usage statistics including input/output tokens.
         """
-        return self._result.usage()
+        if self._usage is None:
+            self._usage = self._result.usage()
+        return self._usage
 
     def new_messages(self) -> list[Any]:
         """Get new messages generated during this run.
@@ -58,7 +63,9 @@ class AgentResult(Generic[T]):
         Returns:
             List of messages from this run (for message history).
         """
-        return self._result.new_messages()
+        if self._new_messages is None:
+            self._new_messages = self._result.new_messages()
+        return self._new_messages
 
     def all_messages(self) -> list[Any]:
         """Get all messages including history.
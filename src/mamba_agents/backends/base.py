@@ -10,7 +10,7 @@ if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelResponse:
     """Response from a model backend.
 
@@ -29,7 +29,7 @@ class ModelResponse:
     finish_reason: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamChunk:
     """A chunk from a streaming response.
 
@@ -10,11 +10,13 @@ Supports OpenAI API and compatible APIs like:
 
 from __future__ import annotations
 
-import json
 import logging
+import time
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 import httpx
+from pydantic_core import from_json, to_json
 
 from mamba_agents.backends.base import ModelBackend, ModelResponse, StreamChunk
 from mamba_agents.backends.profiles import ModelProfile, get_profile
@@ -25,12 +27,62 @@ from mamba_agents.errors.exceptions import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, Mapping
 
     from pydantic import SecretStr
 
 logger = logging.getLogger(__name__)
 
+_SSE_DATA_FIELD = b"data:"
+_SSE_DONE = b"[DONE]"
+# Frames without choices (e.g. keepalives or a trailing usage frame) produce no
+# chunk, so they can be recognized and skipped before decoding
+_SSE_EMPTY_CHOICES = b'"choices":[]'
+# Shared read-only fallback for missing response fields, so parsing does not
+# build throwaway default objects on every call
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+
+async def _iter_sse_data(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Extract event data from a raw server-sent events byte stream.
+
+    Lines are split and matched on bytes, so comments, heartbeats and other
+    fields are skipped without ever being decoded to str. Following the SSE
+    spec, an event ends at a blank line and its ``data:`` lines are joined
+    with newlines. An event left unterminated at the end of the stream is
+    still yielded.
+
+    Args:
+        chunks: Raw response body chunks.
+
+    Yields:
+        The data of each event, without field names or line endings.
+    """
+    field_len = len(_SSE_DATA_FIELD)
+    buffer = b""
+    data_lines: list[bytes] = []
+
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.endswith(b"\r"):
+                line = line[:-1]
+            if not line:
+                if data_lines:
+                    yield data_lines[0] if len(data_lines) == 1 else b"\n".join(data_lines)
+                    data_lines = []
+            elif line.startswith(_SSE_DATA_FIELD):
+                value = line[field_len:]
+                data_lines.append(value[1:] if value.startswith(b" ") else value)
+
+    buffer = buffer.rstrip(b"\r")
+    if buffer.startswith(_SSE_DATA_FIELD):
+        value = buffer[field_len:]
+        data_lines.append(value[1:] if value.startswith(b" ") else value)
+    if data_lines:
+        yield b"\n".join(data_lines)
+
 
 class OpenAICompatibleBackend(ModelBackend):
     """Backend for OpenAI-compatible APIs.
@@ -47,6 +99,8 @@ class OpenAICompatibleBackend(ModelBackend):
         api_key: SecretStr | str | None = None,
         timeout: float = 60.0,
         profile: ModelProfile | None = None,
+        health_check_ttl: float = 5.0,
+        transport: httpx.AsyncBaseTransport | None = None,
     ) -> None:
         """Initialize the backend.
 
@@ -56,11 +110,19 @@ class OpenAICompatibleBackend(ModelBackend):
             api_key: API key for authentication.
             timeout: Request timeout in seconds.
             profile: Custom model profile.
+            health_check_ttl: Seconds to reuse a successful health_check(). 0 disables
+                caching.
+            transport: Optional httpx transport to share a connection pool between
+                backends (e.g. several models on one server). A shared transport is
+                owned by the caller and is not closed by close().
         """
         self._model = model
         self._base_url = base_url.rstrip("/")
         self._timeout = timeout
         self._profile = profile or get_profile(model)
+        self._health_check_ttl = health_check_ttl
+        # Monotonic time of the last successful health check, None if it failed
+        self._healthy_at: float | None = None
 
         # Handle SecretStr
         if api_key is not None:
@@ -70,10 +132,12 @@ class OpenAICompatibleBackend(ModelBackend):
         else:
             self._api_key = None
 
+        self._owns_transport = transport is None
         self._client = httpx.AsyncClient(
             base_url=self._base_url,
             timeout=timeout,
             headers=self._build_headers(),
+            transport=transport,
         )
 
     def _build_headers(self) -> dict[str, str]:
@@ -134,7 +198,7 @@ class OpenAICompatibleBackend(ModelBackend):
         )
 
         try:
-            response = await self._client.post("/chat/completions", json=payload)
+            response = await self._client.post("/chat/completions", content=to_json(payload))
             self._check_response(response)
             data = response.json()
             return self._parse_response(data)
@@ -182,26 +246,31 @@ class OpenAICompatibleBackend(ModelBackend):
         )
 
         try:
-            async with self._client.stream("POST", "/chat/completions", json=payload) as response:
+            async with self._client.stream(
+                "POST", "/chat/completions", content=to_json(payload)
+            ) as response:
+                if response.status_code >= 400:
+                    # Load the error body so _handle_http_error can read its message
+                    await response.aread()
                 self._check_response(response)
 
-                async for line in response.aiter_lines():
-                    if not line or line.startswith(":"):
+                async for frame in _iter_sse_data(response.aiter_bytes()):
+                    if frame.strip() == _SSE_DONE:
+                        yield StreamChunk(is_final=True)
+                        break
+
+                    if _SSE_EMPTY_CHOICES in frame:
                         continue
 
-                    if line.startswith("data: "):
-                        data_str = line[6:]
-                        if data_str.strip() == "[DONE]":
-                            yield StreamChunk(is_final=True)
-                            break
+                    try:
+                        data = from_json(frame)
+                    except ValueError:
+                        logger.warning("Failed to parse stream chunk: %r", frame)
+                        continue
 
-                        try:
-                            data = json.loads(data_str)
-                            chunk = self._parse_stream_chunk(data)
-                            if chunk:
-                                yield chunk
-                        except json.JSONDecodeError:
-                            logger.warning("Failed to parse stream chunk: %s", line)
+                    chunk = self._parse_stream_chunk(data)
+                    if chunk:
+                        yield chunk
 
         except httpx.HTTPStatusError as e:
             self._handle_http_error(e)
@@ -217,19 +286,35 @@ class OpenAICompatibleBackend(ModelBackend):
     async def health_check(self) -> bool:
         """Check if the backend is healthy.
 
+        A successful check is reused for health_check_ttl seconds, so frequent
+        polling does not issue a request every time. Failed checks are not
+        cached, so a backend that recovers is reported healthy right away.
+
         Returns:
             True if reachable.
         """
+        now = time.monotonic()
+        checked_at = self._healthy_at
+        if checked_at is not None and now - checked_at < self._health_check_ttl:
+            return True
+
         try:
             # Try to list models (common endpoint)
             response = await self._client.get("/models")
-            return response.status_code in (200, 401, 403)  # Even auth error means reachable
+            healthy = response.status_code in (200, 401, 403)  # Even auth error means reachable
         except httpx.RequestError:
-            return False
+            healthy = False
+
+        self._healthy_at = now if healthy else None
+        return healthy
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the HTTP client.
+
+        A transport passed in by the caller is left open for its other users.
+        """
+        if self._owns_transport:
+            await self._client.aclose()
 
     def _build_payload(
         self,
@@ -241,7 +326,11 @@ class OpenAICompatibleBackend(ModelBackend):
         stream: bool = False,
         **kwargs: Any,
     ) -> dict[str, Any]:
-        """Build the API request payload."""
+        """Build the API request payload.
+
+        The payload is sent pre-encoded with pydantic_core's to_json, which
+        serializes the messages and tool schemas much faster than json.dumps.
+        """
         payload: dict[str, Any] = {
             "model": self._model,
             "messages": messages,
@@ -272,11 +361,16 @@ class OpenAICompatibleBackend(ModelBackend):
     def _handle_http_error(self, error: httpx.HTTPStatusError) -> None:
         """Handle HTTP errors with appropriate exceptions."""
         status = error.response.status_code
+        message = str(error)
         try:
-            body = error.response.json()
-            message = body.get("error", {}).get("message", str(error))
-        except (json.JSONDecodeError, KeyError):
-            message = str(error)
+            # Decode the raw bytes directly; only error.message is needed
+            body = from_json(error.response.content)
+        except (ValueError, httpx.ResponseNotRead):
+            body = None
+        if isinstance(body, dict):
+            detail = body.get("error")
+            if isinstance(detail, dict) and isinstance(detail.get("message"), str):
+                message = detail["message"]
 
         if status == 401:
             raise AuthenticationError(
@@ -304,8 +398,9 @@ class OpenAICompatibleBackend(ModelBackend):
 
     def _parse_response(self, data: dict[str, Any]) -> ModelResponse:
         """Parse API response into ModelResponse."""
-        choice = data.get("choices", [{}])[0]
-        message = choice.get("message", {})
+        choices = data.get("choices")
+        choice = choices[0] if choices else _EMPTY_MAPPING
+        message = choice.get("message") or _EMPTY_MAPPING
 
         # Parse tool calls if present
         tool_calls = None
@@ -331,12 +426,12 @@ class OpenAICompatibleBackend(ModelBackend):
 
     def _parse_stream_chunk(self, data: dict[str, Any]) -> StreamChunk | None:
         """Parse a streaming chunk."""
-        choices = data.get("choices", [])
+        choices = data.get("choices")
         if not choices:
             return None
 
         choice = choices[0]
-        delta = choice.get("delta", {})
+        delta = choice.get("delta") or _EMPTY_MAPPING
 
         content = delta.get("content", "")
         tool_calls = delta.get("tool_calls")
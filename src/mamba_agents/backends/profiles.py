@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelProfile:
     """Profile defining model capabilities and settings.
 
+    Profiles are immutable because get_profile() hands the same instance to
+    every caller; use dataclasses.replace() to derive a modified profile.
+
     Attributes:
         name: Model identifier.
         provider: Provider name (openai, anthropic, ollama, etc.).
@@ -163,10 +167,33 @@ PROFILES: dict[str, ModelProfile] = {
     ),
 }
 
+# Distinct profile name lengths, longest first. A lookup probes PROFILES once
+# per length instead of scanning every profile name.
+_PREFIX_LENGTHS: list[int] = sorted({len(name) for name in PROFILES}, reverse=True)
+
+# Profiles grouped by provider, in PROFILES order
+_BY_PROVIDER: dict[str, list[ModelProfile]] = {}
+
+
+def _rebuild_provider_index() -> None:
+    """Regroup all registered profiles by provider."""
+    _BY_PROVIDER.clear()
+    for profile in PROFILES.values():
+        _BY_PROVIDER.setdefault(profile.provider, []).append(profile)
+
 
+_rebuild_provider_index()
+
+
+@lru_cache(maxsize=512)
 def get_profile(model_name: str) -> ModelProfile:
     """Get a profile for a model.
 
+    Versioned names resolve to the profile with the longest matching prefix,
+    e.g. "gpt-4o-mini-2024-07-18" matches "gpt-4o-mini" rather than "gpt-4o".
+    Lookups are cached; add profiles with register_profile() so the cache is
+    cleared.
+
     Args:
         model_name: Model name or identifier.
 
@@ -174,13 +201,17 @@ def get_profile(model_name: str) -> ModelProfile:
         ModelProfile for the model, or default profile if unknown.
     """
     # Exact match
-    if model_name in PROFILES:
-        return PROFILES[model_name]
+    profile = PROFILES.get(model_name)
+    if profile is not None:
+        return profile
 
-    # Check for partial matches (e.g., "gpt-4o-2024-05-13" matches "gpt-4o")
-    for profile_name, profile in PROFILES.items():
-        if model_name.startswith(profile_name):
-            return profile
+    # Longest registered name that is a prefix of model_name
+    name_length = len(model_name)
+    for length in _PREFIX_LENGTHS:
+        if length < name_length:
+            profile = PROFILES.get(model_name[:length])
+            if profile is not None:
+                return profile
 
     # Return default profile for unknown models
     return PROFILES["default"]
@@ -192,8 +223,20 @@ def register_profile(profile: ModelProfile) -> None:
     Args:
         profile: The profile to register.
     """
+    replaces_existing = profile.name in PROFILES
     PROFILES[profile.name] = profile
 
+    if replaces_existing:
+        # The replaced profile may be listed under another provider
+        _rebuild_provider_index()
+    else:
+        _BY_PROVIDER.setdefault(profile.provider, []).append(profile)
+
+    if len(profile.name) not in _PREFIX_LENGTHS:
+        _PREFIX_LENGTHS.append(len(profile.name))
+        _PREFIX_LENGTHS.sort(reverse=True)
+    get_profile.cache_clear()
+
 
 def list_profiles() -> list[str]:
     """List all registered profile names.
@@ -213,4 +256,4 @@ def get_profiles_by_provider(provider: str) -> list[ModelProfile]:
     Returns:
         List of profiles for that provider.
     """
-    return [p for p in PROFILES.values() if p.provider == provider]
+    return list(_BY_PROVIDER.get(provider, ()))
@@ -1,12 +1,17 @@
 """Configuration system for mamba-agents."""
 
+from typing import TYPE_CHECKING
+
+from mamba_agents._internal.lazy import lazy_exports
 from mamba_agents.config.logging_config import LoggingConfig
 from mamba_agents.config.model_backend import ModelBackendSettings
 from mamba_agents.config.observability import ObservabilityConfig
 from mamba_agents.config.retry import ErrorRecoveryConfig
-from mamba_agents.config.settings import AgentSettings
 from mamba_agents.config.streaming import StreamingConfig
 
+if TYPE_CHECKING:
+    from mamba_agents.config.settings import AgentSettings
+
 __all__ = [
     "AgentSettings",
     "ErrorRecoveryConfig",
@@ -15,3 +20,11 @@ __all__ = [
     "ObservabilityConfig",
     "StreamingConfig",
 ]
+
+# AgentSettings pulls in pydantic-settings and python-dotenv, so it is only
+# imported when first used
+_LAZY_EXPORTS: dict[str, str] = {
+    "AgentSettings": "mamba_agents.config.settings",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_EXPORTS)
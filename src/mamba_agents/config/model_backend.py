@@ -55,6 +55,14 @@ class ModelBackendSettings(BaseModel):
         description="Maximum tokens to generate",
     )
 
+    def get_api_key(self) -> str | None:
+        """Get the unwrapped API key.
+
+        Returns:
+            The API key value, or None if no key is configured.
+        """
+        return self.api_key.get_secret_value() if self.api_key else None
+
     def get_headers(self) -> dict[str, str]:
         """Get HTTP headers for API requests.
 
@@ -62,6 +70,7 @@ class ModelBackendSettings(BaseModel):
             Dictionary of headers including Authorization if API key is set.
         """
         headers: dict[str, str] = {}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key.get_secret_value()}"
+        api_key = self.get_api_key()
+        if api_key:
+            headers["Authorization"] = f"Bearer {api_key}"
         return headers
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Annotated
+from typing import Annotated, Literal
 
 from pydantic import BaseModel, BeforeValidator, Field, field_validator
 
@@ -15,12 +15,16 @@ def _coerce_retry_level(v: int | str) -> int:
 
 
 RetryLevel = Annotated[int, BeforeValidator(_coerce_retry_level)]
+RetryJitter = Literal["none", "full", "decorrelated"]
 
 
-# Retry configuration per level
-_TOOL_RETRIES = {1: 1, 2: 2, 3: 3}
-_MODEL_RETRIES = {1: 2, 2: 3, 3: 5}
-_BACKOFF_MULTIPLIERS = {1: 2.0, 2: 1.5, 3: 1.2}
+# Retry configuration per level, indexed by retry_level - 1:
+# (tool retries, model retries, backoff multiplier)
+_RETRY_LEVELS: tuple[tuple[int, int, float], ...] = (
+    (1, 2, 2.0),
+    (2, 3, 1.5),
+    (3, 5, 1.2),
+)
 
 
 class ErrorRecoveryConfig(BaseModel):
@@ -37,6 +41,7 @@ class ErrorRecoveryConfig(BaseModel):
         model_max_retries: Override for model retry count.
         initial_backoff_seconds: Initial wait before retry.
         max_backoff_seconds: Maximum wait between retries.
+        jitter: Randomization of retry waits, so concurrent clients spread out.
         circuit_breaker_threshold: Failures before circuit opens.
         circuit_breaker_timeout: Seconds before retry after circuit opens.
         retryable_tool_errors: Tool error types that trigger retry.
@@ -67,6 +72,13 @@ class ErrorRecoveryConfig(BaseModel):
         gt=0,
         description="Maximum wait between retries",
     )
+    jitter: RetryJitter = Field(
+        default="full",
+        description=(
+            "Backoff jitter (none=plain exponential, full=random up to the exponential "
+            "wait, decorrelated=random based on the previous wait)"
+        ),
+    )
     circuit_breaker_threshold: int = Field(
         default=5,
         gt=0,
@@ -102,7 +114,7 @@ class ErrorRecoveryConfig(BaseModel):
         """
         if self.tool_max_retries is not None:
             return self.tool_max_retries
-        return _TOOL_RETRIES[self.retry_level]
+        return _RETRY_LEVELS[self.retry_level - 1][0]
 
     def get_model_retries(self) -> int:
         """Get model retry count based on configuration.
@@ -112,7 +124,7 @@ class ErrorRecoveryConfig(BaseModel):
         """
         if self.model_max_retries is not None:
             return self.model_max_retries
-        return _MODEL_RETRIES[self.retry_level]
+        return _RETRY_LEVELS[self.retry_level - 1][1]
 
     def get_backoff_multiplier(self) -> float:
         """Get exponential backoff multiplier based on retry level.
@@ -120,4 +132,4 @@ class ErrorRecoveryConfig(BaseModel):
         Returns:
             Backoff multiplier for exponential backoff.
         """
-        return _BACKOFF_MULTIPLIERS[self.retry_level]
+        return _RETRY_LEVELS[self.retry_level - 1][2]
@@ -1,14 +1,19 @@
 """Context window management."""
 
-from mamba_agents.context.compaction.base import CompactionResult, CompactionStrategy
-from mamba_agents.context.compaction.hybrid import HybridStrategy
-from mamba_agents.context.compaction.importance import ImportanceScoringStrategy
-from mamba_agents.context.compaction.selective import SelectivePruningStrategy
-from mamba_agents.context.compaction.sliding_window import SlidingWindowStrategy
-from mamba_agents.context.compaction.summarize import SummarizeOlderStrategy
+from typing import TYPE_CHECKING
+
+from mamba_agents._internal.lazy import lazy_exports
 from mamba_agents.context.config import CompactionConfig
-from mamba_agents.context.history import MessageHistory
-from mamba_agents.context.manager import ContextManager, ContextState
+
+if TYPE_CHECKING:
+    from mamba_agents.context.compaction.base import CompactionResult, CompactionStrategy
+    from mamba_agents.context.compaction.hybrid import HybridStrategy
+    from mamba_agents.context.compaction.importance import ImportanceScoringStrategy
+    from mamba_agents.context.compaction.selective import SelectivePruningStrategy
+    from mamba_agents.context.compaction.sliding_window import SlidingWindowStrategy
+    from mamba_agents.context.compaction.summarize import SummarizeOlderStrategy
+    from mamba_agents.context.history import MessageHistory
+    from mamba_agents.context.manager import ContextManager, ContextState
 
 __all__ = [
     "CompactionConfig",
@@ -23,3 +28,18 @@ __all__ = [
     "SlidingWindowStrategy",
     "SummarizeOlderStrategy",
 ]
+
+_LAZY_EXPORTS: dict[str, str] = {
+    "CompactionResult": "mamba_agents.context.compaction.base",
+    "CompactionStrategy": "mamba_agents.context.compaction.base",
+    "ContextManager": "mamba_agents.context.manager",
+    "ContextState": "mamba_agents.context.manager",
+    "HybridStrategy": "mamba_agents.context.compaction.hybrid",
+    "ImportanceScoringStrategy": "mamba_agents.context.compaction.importance",
+    "MessageHistory": "mamba_agents.context.history",
+    "SelectivePruningStrategy": "mamba_agents.context.compaction.selective",
+    "SlidingWindowStrategy": "mamba_agents.context.compaction.sliding_window",
+    "SummarizeOlderStrategy": "mamba_agents.context.compaction.summarize",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_EXPORTS)
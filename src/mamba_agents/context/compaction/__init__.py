@@ -1,11 +1,23 @@
 """Context compaction strategies."""
 
-from mamba_agents.context.compaction.base import CompactionResult, CompactionStrategy
-from mamba_agents.context.compaction.hybrid import HybridStrategy
-from mamba_agents.context.compaction.importance import ImportanceScoringStrategy
-from mamba_agents.context.compaction.selective import SelectivePruningStrategy
-from mamba_agents.context.compaction.sliding_window import SlidingWindowStrategy
-from mamba_agents.context.compaction.summarize import SummarizeOlderStrategy
+from typing import TYPE_CHECKING
+
+from mamba_agents._internal.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from mamba_agents.context.compaction.base import (
+        CompactionResult,
+        CompactionStrategy,
+        count_message_tokens,
+        shared_token_counts,
+        use_token_counter,
+        warmup,
+    )
+    from mamba_agents.context.compaction.hybrid import HybridStrategy
+    from mamba_agents.context.compaction.importance import ImportanceScoringStrategy
+    from mamba_agents.context.compaction.selective import SelectivePruningStrategy
+    from mamba_agents.context.compaction.sliding_window import SlidingWindowStrategy
+    from mamba_agents.context.compaction.summarize import SummarizeOlderStrategy
 
 __all__ = [
     "CompactionResult",
@@ -15,4 +27,24 @@ __all__ = [
     "SelectivePruningStrategy",
     "SlidingWindowStrategy",
     "SummarizeOlderStrategy",
+    "count_message_tokens",
+    "shared_token_counts",
+    "use_token_counter",
+    "warmup",
 ]
+
+_LAZY_EXPORTS: dict[str, str] = {
+    "CompactionResult": "mamba_agents.context.compaction.base",
+    "CompactionStrategy": "mamba_agents.context.compaction.base",
+    "HybridStrategy": "mamba_agents.context.compaction.hybrid",
+    "ImportanceScoringStrategy": "mamba_agents.context.compaction.importance",
+    "SelectivePruningStrategy": "mamba_agents.context.compaction.selective",
+    "SlidingWindowStrategy": "mamba_agents.context.compaction.sliding_window",
+    "SummarizeOlderStrategy": "mamba_agents.context.compaction.summarize",
+    "count_message_tokens": "mamba_agents.context.compaction.base",
+    "shared_token_counts": "mamba_agents.context.compaction.base",
+    "use_token_counter": "mamba_agents.context.compaction.base",
+    "warmup": "mamba_agents.context.compaction.base",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_EXPORTS)
@@ -3,11 +3,144 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
+from mamba_agents.tokens.counter import LIST_OVERHEAD_TOKENS, TokenCounter
 
-@dataclass
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+# Per-message token counts shared by the strategies taking part in one
+# compaction, keyed by id(). Entries keep the message itself so a count is
+# only reused for the same object, never for a new dict that got its id.
+_token_counts: ContextVar[dict[int, tuple[dict[str, Any], int]] | None] = ContextVar(
+    "_token_counts", default=None
+)
+# Counter overriding the shared default for the current context
+_active_token_counter: ContextVar[TokenCounter | None] = ContextVar(
+    "_active_token_counter", default=None
+)
+
+
+@lru_cache(maxsize=1)
+def _default_token_counter() -> TokenCounter:
+    """Get the token counter shared by all compaction strategies.
+
+    Returns:
+        A TokenCounter with the default tokenizer configuration.
+    """
+    return TokenCounter()
+
+
+def warmup() -> None:
+    """Load the tokenizer used by compaction ahead of time.
+
+    The first compaction otherwise pays for loading the tiktoken encoding
+    (a few hundred milliseconds). Call this at process start, e.g. from a
+    web server's startup hook, to move that cost off the request path. The
+    encoding is cached process-wide, so token counters created later with
+    the same encoding start warm too.
+    """
+    _default_token_counter()
+
+
+def _get_token_counter() -> TokenCounter:
+    """Get the token counter strategies should use in the current context.
+
+    Returns:
+        The counter set by use_token_counter(), or the shared default.
+    """
+    return _active_token_counter.get() or _default_token_counter()
+
+
+@contextmanager
+def use_token_counter(counter: TokenCounter) -> Iterator[None]:
+    """Make compaction strategies count tokens with a specific counter.
+
+    ContextManager uses this so compaction agrees with its own token
+    counts; it also lets tests substitute a counter. The override applies
+    to the current context only, so concurrent tasks are unaffected.
+
+    Args:
+        counter: Token counter to use within the block.
+
+    Yields:
+        None.
+    """
+    token = _active_token_counter.set(counter)
+    try:
+        yield
+    finally:
+        _active_token_counter.reset(token)
+
+
+@contextmanager
+def shared_token_counts(
+    known: Iterable[tuple[dict[str, Any], int]] = (),
+) -> Iterator[None]:
+    """Reuse per-message token counts across strategies within the block.
+
+    Strategies count the same message dicts repeatedly (e.g. each strategy
+    of a hybrid run recounts the history it receives). Inside this block
+    each message is tokenized once. Nested blocks share the outer cache.
+    Code driving strategies, such as ContextManager, can seed the block with
+    counts it already has, so those messages are never re-tokenized.
+
+    Args:
+        known: (message, token count) pairs already counted by the caller
+            with the active counter, used to seed the cache.
+
+    Yields:
+        None.
+    """
+    cache = _token_counts.get()
+    if cache is not None:
+        cache.update((id(msg), (msg, count)) for msg, count in known)
+        yield
+        return
+
+    token = _token_counts.set({id(msg): (msg, count) for msg, count in known})
+    try:
+        yield
+    finally:
+        _token_counts.reset(token)
+
+
+def count_message_tokens(messages: Iterable[dict[str, Any]]) -> list[int]:
+    """Count tokens for each message the way compaction strategies do.
+
+    Uses the counter set by use_token_counter() (or the shared default) and,
+    inside a shared_token_counts() block, reuses counts already known for
+    the same message dicts. Code driving strategies can use this to count
+    their results consistently with the strategies themselves.
+
+    Args:
+        messages: Messages to count.
+
+    Returns:
+        Approximate token count of each message, in order, excluding
+        LIST_OVERHEAD_TOKENS.
+    """
+    count_message = _get_token_counter().count_message
+    cache = _token_counts.get()
+    if cache is None:
+        return [count_message(msg) for msg in messages]
+
+    counts: list[int] = []
+    for msg in messages:
+        entry = cache.get(id(msg))
+        if entry is None or entry[0] is not msg:
+            entry = (msg, count_message(msg))
+            cache[id(msg)] = entry
+        counts.append(entry[1])
+    return counts
+
+
+@dataclass(slots=True, frozen=True)
 class CompactionResult:
     """Result of a compaction operation.
 
@@ -53,7 +186,8 @@ class CompactionStrategy(ABC):
         """Compact messages to fit within target token count.
 
         Args:
-            messages: Messages to compact.
+            messages: Messages to compact. The list and its message dicts
+                must not be modified; return new lists in the result instead.
             target_tokens: Target token count after compaction.
             preserve_recent: Number of recent turns to preserve.
 
@@ -62,16 +196,29 @@ class CompactionStrategy(ABC):
         """
         ...
 
-    def _count_tokens(self, messages: list[dict[str, Any]]) -> int:
+    def _count_tokens(self, messages: Iterable[dict[str, Any]]) -> int:
         """Count tokens in messages.
 
         Args:
-            messages: Messages to count.
+            messages: Messages to count. Any iterable is accepted, so callers
+                can pass itertools.chain() instead of concatenating lists.
 
         Returns:
             Approximate token count.
         """
-        from mamba_agents.tokens import TokenCounter
+        return sum(self._count_each(messages)) + LIST_OVERHEAD_TOKENS
+
+    def _count_each(self, messages: Iterable[dict[str, Any]]) -> list[int]:
+        """Count tokens for each message individually.
+
+        The sum of the counts plus LIST_OVERHEAD_TOKENS equals
+        _count_tokens() for the same messages, so totals for any slice can
+        be derived without re-tokenizing.
+
+        Args:
+            messages: Messages to count.
 
-        counter = TokenCounter()
-        return counter.count_messages(messages)
+        Returns:
+            Approximate token count of each message, in order.
+        """
+        return count_message_tokens(messages)
@@ -4,7 +4,11 @@ from __future__ import annotations
 
 from typing import Any
 
-from mamba_agents.context.compaction.base import CompactionResult, CompactionStrategy
+from mamba_agents.context.compaction.base import (
+    CompactionResult,
+    CompactionStrategy,
+    shared_token_counts,
+)
 from mamba_agents.context.compaction.selective import SelectivePruningStrategy
 from mamba_agents.context.compaction.sliding_window import SlidingWindowStrategy
 
@@ -13,7 +17,8 @@ class HybridStrategy(CompactionStrategy):
     """Combination of strategies with configurable weights.
 
     Applies multiple strategies in sequence, using each one
-    to progressively reduce context size.
+    to progressively reduce context size. Strategies that do not
+    reduce the token count are skipped.
     """
 
     def __init__(
@@ -46,6 +51,26 @@ class HybridStrategy(CompactionStrategy):
     ) -> CompactionResult:
         """Compact using multiple strategies.
 
+        Args:
+            messages: Messages to compact.
+            target_tokens: Target token count.
+            preserve_recent: Number of recent messages to preserve.
+
+        Returns:
+            CompactionResult with compacted messages.
+        """
+        # Each message is tokenized once, however many strategies count it
+        with shared_token_counts():
+            return await self._compact(messages, target_tokens, preserve_recent)
+
+    async def _compact(
+        self,
+        messages: list[dict[str, Any]],
+        target_tokens: int,
+        preserve_recent: int,
+    ) -> CompactionResult:
+        """Run the strategies in order until the target is reached.
+
         Args:
             messages: Messages to compact.
             target_tokens: Target token count.
@@ -66,11 +91,12 @@ class HybridStrategy(CompactionStrategy):
             )
 
         current_messages = messages
+        current_tokens = tokens_before
         total_removed = 0
         strategies_used = []
 
         for strategy in self._strategies:
-            if self._count_tokens(current_messages) <= target_tokens:
+            if current_tokens <= target_tokens:
                 break
 
             result = await strategy.compact(
@@ -79,16 +105,22 @@ class HybridStrategy(CompactionStrategy):
                 preserve_recent,
             )
 
+            # A strategy that made no progress is skipped, so its output never
+            # replaces a smaller context or counts as a step that was applied
+            if result.tokens_after >= current_tokens:
+                continue
+
+            # Each strategy reports the size of what it returns, so the
+            # messages are not recounted between steps
             current_messages = result.messages
+            current_tokens = result.tokens_after
             total_removed += result.removed_count
             strategies_used.append(strategy.name)
 
-        tokens_after = self._count_tokens(current_messages)
-
         return CompactionResult(
             messages=current_messages,
             removed_count=total_removed,
             tokens_before=tokens_before,
-            tokens_after=tokens_after,
+            tokens_after=current_tokens,
             strategy=f"{self.name}({'+'.join(strategies_used)})",
         )
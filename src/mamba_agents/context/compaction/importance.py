@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from mamba_agents.context.compaction.base import CompactionResult, CompactionStrategy
+from mamba_agents.tokens.counter import LIST_OVERHEAD_TOKENS
 
 if TYPE_CHECKING:
     from pydantic_ai import Agent
@@ -49,7 +50,8 @@ class ImportanceScoringStrategy(CompactionStrategy):
         Returns:
             CompactionResult with compacted messages.
         """
-        tokens_before = self._count_tokens(messages)
+        counts = self._count_each(messages)
+        tokens_before = sum(counts) + LIST_OVERHEAD_TOKENS
 
         if tokens_before <= target_tokens:
             return CompactionResult(
@@ -78,20 +80,19 @@ class ImportanceScoringStrategy(CompactionStrategy):
         # Sort removable by score (lowest first)
         removable.sort(key=lambda x: x[2])
 
-        # Remove lowest scored until under target
+        # Remove lowest scored until under target, keeping a running total
+        # instead of rebuilding and recounting the remaining messages
         removed_count = 0
-        while removable:
-            current = [x[1] for x in removable] + [x[1] for x in preserved]
-            if self._count_tokens(current) <= target_tokens:
+        tokens_after = tokens_before
+        for index, _, _ in removable:
+            if tokens_after <= target_tokens:
                 break
-
-            removable.pop(0)  # Remove lowest scored
+            tokens_after -= counts[index]
             removed_count += 1
 
         # Reconstruct messages in original order
-        remaining = sorted(removable + preserved, key=lambda x: x[0])
+        remaining = sorted(removable[removed_count:] + preserved, key=lambda x: x[0])
         result_messages = [x[1] for x in remaining]
-        tokens_after = self._count_tokens(result_messages)
 
         return CompactionResult(
             messages=result_messages,
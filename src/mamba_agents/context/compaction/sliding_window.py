@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
+from itertools import accumulate
 from typing import Any
 
 from mamba_agents.context.compaction.base import CompactionResult, CompactionStrategy
+from mamba_agents.tokens.counter import LIST_OVERHEAD_TOKENS
 
 
 class SlidingWindowStrategy(CompactionStrategy):
@@ -35,7 +38,8 @@ class SlidingWindowStrategy(CompactionStrategy):
         Returns:
             CompactionResult with compacted messages.
         """
-        tokens_before = self._count_tokens(messages)
+        counts = self._count_each(messages)
+        tokens_before = sum(counts) + LIST_OVERHEAD_TOKENS
 
         if tokens_before <= target_tokens:
             return CompactionResult(
@@ -46,22 +50,20 @@ class SlidingWindowStrategy(CompactionStrategy):
                 strategy=self.name,
             )
 
-        # Separate preserved and removable messages
+        # Only messages before the preserved tail may be removed
         if preserve_recent > 0 and len(messages) > preserve_recent:
-            preserved = messages[-preserve_recent:]
-            removable = messages[:-preserve_recent]
+            removable_count = len(messages) - preserve_recent
         else:
-            preserved = []
-            removable = messages.copy()
+            removable_count = len(messages)
 
-        # Remove from the beginning until we're under target
-        removed_count = 0
-        while removable and self._count_tokens(removable + preserved) > target_tokens:
-            removable.pop(0)
-            removed_count += 1
+        # prefix[k] is the token count of the oldest k messages. Dropping them
+        # leaves tokens_before - prefix[k], so the smallest k that reaches the
+        # target is found by binary search rather than by re-counting.
+        prefix = list(accumulate(counts[:removable_count], initial=0))
+        removed_count = min(bisect_left(prefix, tokens_before - target_tokens), removable_count)
 
-        result_messages = removable + preserved
-        tokens_after = self._count_tokens(result_messages)
+        result_messages = messages[removed_count:]
+        tokens_after = tokens_before - prefix[removed_count]
 
         return CompactionResult(
             messages=result_messages,
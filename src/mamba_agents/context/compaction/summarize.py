@@ -5,10 +5,16 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from mamba_agents.context.compaction.base import CompactionResult, CompactionStrategy
+from mamba_agents.tokens.counter import LIST_OVERHEAD_TOKENS
 
 if TYPE_CHECKING:
     from pydantic_ai import Agent
 
+# Number of distinct tool names listed in a simple summary
+_MAX_SUMMARY_TOOL_NAMES = 5
+# Shared fallback for tool calls without a function entry
+_EMPTY_FUNCTION: dict[str, Any] = {}
+
 
 class SummarizeOlderStrategy(CompactionStrategy):
     """Summarize older messages while keeping recent ones verbatim.
@@ -49,7 +55,8 @@ class SummarizeOlderStrategy(CompactionStrategy):
         Returns:
             CompactionResult with compacted messages.
         """
-        tokens_before = self._count_tokens(messages)
+        counts = self._count_each(messages)
+        tokens_before = sum(counts) + LIST_OVERHEAD_TOKENS
 
         if tokens_before <= target_tokens:
             return CompactionResult(
@@ -74,7 +81,7 @@ class SummarizeOlderStrategy(CompactionStrategy):
                 messages=to_preserve,
                 removed_count=0,
                 tokens_before=tokens_before,
-                tokens_after=self._count_tokens(to_preserve),
+                tokens_after=tokens_before,
                 strategy=self.name,
             )
 
@@ -88,7 +95,12 @@ class SummarizeOlderStrategy(CompactionStrategy):
         }
 
         result_messages = [summary_message] + to_preserve
-        tokens_after = self._count_tokens(result_messages)
+        # Only the new summary needs tokenizing; the preserved tail was
+        # already counted above
+        preserved_tokens = sum(counts[len(to_summarize) :])
+        tokens_after = (
+            self._count_each([summary_message])[0] + preserved_tokens + LIST_OVERHEAD_TOKENS
+        )
 
         return CompactionResult(
             messages=result_messages,
@@ -137,18 +149,36 @@ class SummarizeOlderStrategy(CompactionStrategy):
             summary_parts.append(f"Topics discussed: {', '.join(topics)}...")
 
         if tool_calls:
-            tool_names = []
-            for m in tool_calls:
-                for tc in m.get("tool_calls", []):
-                    if isinstance(tc, dict):
-                        name = tc.get("function", {}).get("name", "")
-                        if name and name not in tool_names:
-                            tool_names.append(name)
+            tool_names = self._first_tool_names(tool_calls, _MAX_SUMMARY_TOOL_NAMES)
             if tool_names:
-                summary_parts.append(f"Tools used: {', '.join(tool_names[:5])}")
+                summary_parts.append(f"Tools used: {', '.join(tool_names)}")
 
         return " ".join(summary_parts)
 
+    def _first_tool_names(self, messages: list[dict[str, Any]], limit: int) -> list[str]:
+        """Collect distinct tool names in order of first use.
+
+        Args:
+            messages: Assistant messages with tool calls.
+            limit: Maximum number of names to collect.
+
+        Returns:
+            Up to limit distinct tool names.
+        """
+        tool_names: list[str] = []
+        seen: set[str] = set()
+        for m in messages:
+            for tc in m.get("tool_calls") or ():
+                if not isinstance(tc, dict):
+                    continue
+                name = (tc.get("function") or _EMPTY_FUNCTION).get("name")
+                if name and name not in seen:
+                    seen.add(name)
+                    tool_names.append(name)
+                    if len(tool_names) == limit:
+                        return tool_names
+        return tool_names
+
     def _format_for_summary(self, messages: list[dict[str, Any]]) -> str:
         """Format messages for summarization prompt.
 
@@ -158,9 +188,8 @@ class SummarizeOlderStrategy(CompactionStrategy):
         Returns:
             Formatted text.
         """
-        lines = []
-        for msg in messages:
-            role = msg.get("role", "unknown")
-            content = msg.get("content", "")
-            lines.append(f"{role}: {content}")
-        return "\n".join(lines)
+        # str.join materializes its input, so a list comprehension is cheaper
+        # than a generator or an append loop here
+        return "\n".join(
+            [f"{msg.get('role', 'unknown')}: {msg.get('content', '')}" for msg in messages]
+        )
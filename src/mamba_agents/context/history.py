@@ -37,7 +37,9 @@ class MessageHistory:
         Args:
             content: The message content.
         """
-        self.add_message("user", content)
+        # Built directly rather than through add_message(), which costs a
+        # keyword-argument dict and a merge on the most frequent call
+        self.messages.append({"role": "user", "content": content})
 
     def add_assistant_message(
         self, content: str, tool_calls: list[dict[str, Any]] | None = None
@@ -48,10 +50,10 @@ class MessageHistory:
             content: The message content.
             tool_calls: Optional tool calls made by the assistant.
         """
-        kwargs = {}
+        message: dict[str, Any] = {"role": "assistant", "content": content}
         if tool_calls:
-            kwargs["tool_calls"] = tool_calls
-        self.add_message("assistant", content, **kwargs)
+            message["tool_calls"] = tool_calls
+        self.messages.append(message)
 
     def add_tool_result(self, tool_call_id: str, content: str) -> None:
         """Add a tool result message.
@@ -60,7 +62,7 @@ class MessageHistory:
             tool_call_id: ID of the tool call this is responding to.
             content: The tool result content.
         """
-        self.add_message("tool", content, tool_call_id=tool_call_id)
+        self.messages.append({"role": "tool", "content": content, "tool_call_id": tool_call_id})
 
     def get_messages(self) -> list[dict[str, Any]]:
         """Get all messages.
@@ -79,7 +81,7 @@ class MessageHistory:
         Returns:
             List of recent messages.
         """
-        return self.messages[-n:] if n > 0 else []
+        return self.messages[max(0, len(self.messages) - n) :]
 
     def get_turns(self) -> list[list[dict[str, Any]]]:
         """Get messages grouped by turns.
@@ -113,14 +115,19 @@ class MessageHistory:
         Returns:
             List of messages from recent turns.
         """
-        turns = self.get_turns()
-        recent_turns = turns[-n:] if n > 0 else []
+        if n <= 0:
+            return []
 
-        result = []
-        for turn in recent_turns:
-            result.extend(turn)
+        # Walk back from the end to the first message of the nth most recent
+        # turn, so only the recent turns are scanned and copied
+        messages = self.messages
+        for start in range(len(messages) - 1, 0, -1):
+            if messages[start]["role"] == "user":
+                n -= 1
+                if n == 0:
+                    return messages[start:]
 
-        return result
+        return messages.copy()
 
     def clear(self) -> None:
         """Clear all messages."""
@@ -136,7 +143,7 @@ class MessageHistory:
             The removed messages.
         """
         removed = self.messages[:n]
-        self.messages = self.messages[n:]
+        del self.messages[:n]
         return removed
 
     def __len__(self) -> int:
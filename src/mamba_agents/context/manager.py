@@ -3,20 +3,57 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
+from importlib import import_module
 from typing import TYPE_CHECKING, Any
 
-from mamba_agents.context.compaction.base import CompactionResult, CompactionStrategy
-from mamba_agents.context.compaction.hybrid import HybridStrategy
-from mamba_agents.context.compaction.importance import ImportanceScoringStrategy
-from mamba_agents.context.compaction.selective import SelectivePruningStrategy
-from mamba_agents.context.compaction.sliding_window import SlidingWindowStrategy
-from mamba_agents.context.compaction.summarize import SummarizeOlderStrategy
+from mamba_agents._internal.aio import run_sync
+from mamba_agents.context.compaction.base import (
+    CompactionResult,
+    CompactionStrategy,
+    count_message_tokens,
+    shared_token_counts,
+    use_token_counter,
+)
 from mamba_agents.context.config import CompactionConfig
 from mamba_agents.context.history import MessageHistory
 from mamba_agents.tokens import TokenCounter
+from mamba_agents.tokens.counter import LIST_OVERHEAD_TOKENS
 
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Iterable, Iterator
+
+# Strategy name -> (module, class name). Modules are imported on first use, so
+# only the strategies a configuration actually selects are loaded.
+_STRATEGIES: dict[str, tuple[str, str]] = {
+    "sliding_window": ("mamba_agents.context.compaction.sliding_window", "SlidingWindowStrategy"),
+    "summarize_older": ("mamba_agents.context.compaction.summarize", "SummarizeOlderStrategy"),
+    "selective_pruning": ("mamba_agents.context.compaction.selective", "SelectivePruningStrategy"),
+    "importance_scoring": (
+        "mamba_agents.context.compaction.importance",
+        "ImportanceScoringStrategy",
+    ),
+    "hybrid": ("mamba_agents.context.compaction.hybrid", "HybridStrategy"),
+}
+
+
+@lru_cache(maxsize=8)
+def _get_strategy(name: str) -> CompactionStrategy:
+    """Get the shared compaction strategy for a configured strategy name.
+
+    Default-constructed strategies hold no per-conversation state, so one
+    instance per name is shared by every context manager.
+
+    Args:
+        name: Strategy name from CompactionConfig. Unknown names fall back
+            to the sliding window strategy.
+
+    Returns:
+        CompactionStrategy instance.
+    """
+    module_name, class_name = _STRATEGIES.get(name, _STRATEGIES["sliding_window"])
+    strategy_class: type[CompactionStrategy] = getattr(import_module(module_name), class_name)
+    return strategy_class()
 
 
 @dataclass
@@ -47,18 +84,31 @@ class ContextManager:
         self,
         config: CompactionConfig | None = None,
         token_counter: TokenCounter | None = None,
+        defer_tokenize: bool = False,
     ) -> None:
         """Initialize the context manager.
 
         Args:
             config: Compaction configuration.
             token_counter: Token counter instance.
+            defer_tokenize: If True, messages are stored without tokenizing and
+                only counted on the next get_token_count() or should_compact().
         """
         self._config = config or CompactionConfig()
         self._counter = token_counter or TokenCounter()
         self._history = MessageHistory()
         self._compaction_history: list[CompactionResult] = []
-        self._strategy = self._create_strategy()
+        self._strategy = _get_strategy(self._config.strategy)
+        self._version = 0
+        self._defer_tokenize = defer_tokenize
+        # Token count of each stored message that has been tokenized so far (a
+        # prefix of the history) and their running sum, excluding list overhead
+        self._message_counts: list[int] = []
+        self._message_tokens = 0
+        # Token count of the system prompt, None until counted after a change
+        self._system_prompt_tokens: int | None = None
+        # Last total from get_token_count() and the version it was computed at
+        self._token_count: tuple[int, int] | None = None
 
     @property
     def config(self) -> CompactionConfig:
@@ -69,22 +119,18 @@ class ContextManager:
         """
         return self._config
 
-    def _create_strategy(self) -> CompactionStrategy:
-        """Create the compaction strategy from config.
+    @property
+    def version(self) -> int:
+        """Get the message history version.
+
+        The version increases every time the stored messages change, so
+        callers can cache data derived from get_messages() and reuse it
+        while the version is unchanged.
 
         Returns:
-            CompactionStrategy instance.
+            Monotonically increasing version number.
         """
-        strategy_map = {
-            "sliding_window": SlidingWindowStrategy,
-            "summarize_older": SummarizeOlderStrategy,
-            "selective_pruning": SelectivePruningStrategy,
-            "importance_scoring": ImportanceScoringStrategy,
-            "hybrid": HybridStrategy,
-        }
-
-        strategy_class = strategy_map.get(self._config.strategy, SlidingWindowStrategy)
-        return strategy_class()
+        return self._version
 
     def add_messages(self, messages: list[dict[str, Any]]) -> None:
         """Add messages to the history.
@@ -92,14 +138,70 @@ class ContextManager:
         Args:
             messages: Messages to add.
         """
-        for msg in messages:
-            role = msg.get("role", "")
-            content = msg.get("content", "")
+        self.extend_from_iter(messages)
+
+    def extend_from_iter(self, messages: Iterable[dict[str, Any]]) -> None:
+        """Add messages from any iterable, counting tokens incrementally.
 
-            if role == "system" and self._config.preserve_system_prompt:
-                self._history.system_prompt = content
-            else:
-                self._history.messages.append(msg)
+        Each message is tokenized once, either as it is added or (with
+        defer_tokenize) on the next token count request, so the running token
+        count never needs to re-tokenize messages already in the history.
+
+        Args:
+            messages: Messages to add. Any iterable is accepted and consumed once.
+        """
+        if not self._config.preserve_system_prompt:
+            self._history.messages.extend(messages)
+        else:
+            messages = messages if isinstance(messages, list) else list(messages)
+            kept = [msg for msg in messages if msg.get("role", "") != "system"]
+            if len(kept) != len(messages):
+                # The last system message wins, as if each one were applied in turn
+                system_msg = next(m for m in reversed(messages) if m.get("role", "") == "system")
+                self._history.system_prompt = system_msg.get("content", "")
+                self._system_prompt_tokens = None
+                self._token_count = None
+            self._history.messages.extend(kept)
+
+        if not self._defer_tokenize:
+            self._count_pending()
+        self._version += 1
+
+    def ingest_and_check(
+        self,
+        messages: Iterable[dict[str, Any]],
+        auto_compact: bool,
+    ) -> bool:
+        """Add messages and report whether compaction is now needed.
+
+        Combines extend_from_iter() and should_compact() so the post-run
+        path touches the new messages once.
+
+        Args:
+            messages: Messages to add. Any iterable is accepted and consumed once.
+            auto_compact: Whether automatic compaction is enabled. When False
+                the threshold is not checked, so deferred tokenizing stays lazy.
+
+        Returns:
+            True if auto_compact is set and the compaction threshold is reached.
+        """
+        self.extend_from_iter(messages)
+        return auto_compact and self.should_compact()
+
+    def _count_pending(self) -> int:
+        """Tokenize messages added since the last count.
+
+        Returns:
+            Token count of all stored messages, excluding list overhead.
+        """
+        messages = self._history.messages
+        counts = self._message_counts
+        if len(counts) < len(messages):
+            count_message = self._counter.count_message
+            new_counts = [count_message(msg) for msg in messages[len(counts) :]]
+            counts.extend(new_counts)
+            self._message_tokens += sum(new_counts)
+        return self._message_tokens
 
     def get_messages(self) -> list[dict[str, Any]]:
         """Get all messages.
@@ -109,20 +211,53 @@ class ContextManager:
         """
         return self._history.get_messages()
 
+    def iter_messages(self) -> Iterator[dict[str, Any]]:
+        """Iterate over stored messages without copying the history.
+
+        Unlike get_messages(), no list copy is made, so the history must not
+        be modified while the iterator is being consumed.
+
+        Returns:
+            Iterator over the stored message dictionaries.
+        """
+        return iter(self._history.messages)
+
+    def has_messages(self) -> bool:
+        """Check whether any messages are stored, without copying them.
+
+        Returns:
+            True if the history contains at least one message.
+        """
+        return bool(self._history.messages)
+
     def get_token_count(self) -> int:
         """Get current token count.
 
+        The total is cached until the messages or system prompt change, so
+        repeated calls and should_compact() checks are a version comparison.
+
         Returns:
             Approximate token count.
         """
-        messages = self.get_messages()
-        count = self._counter.count_messages(messages)
-
-        if self._history.system_prompt:
-            count += self._counter.count(self._history.system_prompt)
+        cached = self._token_count
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
 
+        count = self._count_pending() + LIST_OVERHEAD_TOKENS + self._count_system_prompt()
+        self._token_count = (self._version, count)
         return count
 
+    def _count_system_prompt(self) -> int:
+        """Get the token count of the system prompt, counting it once per change.
+
+        Returns:
+            Token count of the system prompt, or 0 if there is none.
+        """
+        if self._system_prompt_tokens is None:
+            prompt = self._history.system_prompt
+            self._system_prompt_tokens = self._counter.count(prompt) if prompt else 0
+        return self._system_prompt_tokens
+
     def should_compact(self) -> bool:
         """Check if compaction threshold is reached.
 
@@ -137,20 +272,51 @@ class ContextManager:
         Returns:
             CompactionResult with details of what was done.
         """
-        messages = self.get_messages()
-
-        result = await self._strategy.compact(
-            messages,
-            self._config.target_tokens,
-            self._config.preserve_recent_turns,
-        )
+        # Strategies read the message list without modifying it, so the stored
+        # list is passed as is. They keep or drop existing message dicts rather
+        # than editing them, so counts for kept messages can be reused by identity
+        messages = self._history.messages
+        # Count any messages still pending (defer_tokenize), so every stored
+        # message has a known count
+        self._count_pending()
+
+        # Strategies count with this manager's counter and start from the
+        # counts already known, so kept messages are never re-tokenized. The
+        # counts must line up with the messages; strict zip fails loudly if not
+        with (
+            use_token_counter(self._counter),
+            shared_token_counts(zip(messages, self._message_counts, strict=True)),
+        ):
+            result = await self._strategy.compact(
+                messages,
+                self._config.target_tokens,
+                self._config.preserve_recent_turns,
+            )
+            # New messages such as a summary were counted while compacting, so
+            # the counts for the result come from the same shared cache
+            self._message_counts = count_message_tokens(result.messages)
 
         # Update history with compacted messages
         self._history.messages = result.messages
         self._compaction_history.append(result)
+        self._message_tokens = sum(self._message_counts)
+        self._version += 1
 
         return result
 
+    def compact_sync(self) -> CompactionResult:
+        """Apply compaction synchronously.
+
+        Runs compact() on the thread's shared event loop, so repeated calls
+        do not pay for creating and closing a new loop each time. Can also be
+        called while an event loop is running, e.g. in Jupyter; compaction
+        then runs on a worker thread and blocks the caller until done.
+
+        Returns:
+            CompactionResult with details of what was done.
+        """
+        return run_sync(self.compact())
+
     def get_context_state(self) -> ContextState:
         """Get the current context state.
 
@@ -179,11 +345,16 @@ class ContextManager:
             prompt: The system prompt.
         """
         self._history.system_prompt = prompt
+        self._system_prompt_tokens = None
+        self._token_count = None
 
     def clear(self) -> None:
         """Clear all context."""
         self._history.clear()
         self._compaction_history.clear()
+        self._message_counts = []
+        self._message_tokens = 0
+        self._version += 1
 
     def get_compaction_history(self) -> list[CompactionResult]:
         """Get history of compactions.
@@ -22,6 +22,13 @@ class CircuitState(Enum):
     HALF_OPEN = "half_open"  # Testing if service recovered
 
 
+# Module-level aliases so hot-path state checks are a global lookup and an
+# identity comparison rather than an enum class attribute lookup
+_CLOSED = CircuitState.CLOSED
+_OPEN = CircuitState.OPEN
+_HALF_OPEN = CircuitState.HALF_OPEN
+
+
 @dataclass
 class CircuitBreakerConfig:
     """Configuration for the circuit breaker.
@@ -58,14 +65,6 @@ class CircuitStats:
     state_changes: int = 0
 
 
-@dataclass
-class FailureRecord:
-    """Record of a single failure."""
-
-    timestamp: float
-    exception: Exception
-
-
 class CircuitBreakerOpenError(Exception):
     """Raised when circuit breaker is open and rejecting calls."""
 
@@ -124,8 +123,11 @@ class CircuitBreaker(Generic[T]):
         """
         self.name = name
         self.config = config or CircuitBreakerConfig()
-        self._state = CircuitState.CLOSED
-        self._failures: deque[FailureRecord] = deque()
+        self._state = _CLOSED
+        # Timestamps of recent failures. Only the last failure_threshold of them
+        # can affect the trip decision, and exceptions are not kept so their
+        # tracebacks and frames are freed straight away
+        self._failures: deque[float] = deque(maxlen=max(1, self.config.failure_threshold))
         self._last_failure_time: float | None = None
         self._half_open_successes = 0
         self._stats = CircuitStats()
@@ -133,21 +135,39 @@ class CircuitBreaker(Generic[T]):
     @property
     def state(self) -> CircuitState:
         """Get current circuit state, transitioning if needed."""
-        if self._state == CircuitState.OPEN:
-            if self._should_attempt_reset():
-                self._transition_to(CircuitState.HALF_OPEN)
-        return self._state
+        return self._current_state()
 
     @property
     def stats(self) -> CircuitStats:
         """Get circuit breaker statistics."""
         return self._stats
 
-    def _should_attempt_reset(self) -> bool:
+    @staticmethod
+    def _now() -> float:
+        """Get the current time from the monotonic clock.
+
+        Failure times are only compared with each other, so wall-clock
+        adjustments must not open or close the circuit.
+        """
+        return time.monotonic()
+
+    def _current_state(self, now: float | None = None) -> CircuitState:
+        """Get current circuit state, transitioning from open to half-open if due.
+
+        Args:
+            now: Current monotonic time, read from the clock if None. The
+                clock is only read while the circuit is open.
+        """
+        if self._state is _OPEN:
+            if self._should_attempt_reset(self._now() if now is None else now):
+                self._transition_to(_HALF_OPEN)
+        return self._state
+
+    def _should_attempt_reset(self, now: float) -> bool:
         """Check if enough time has passed to try half-open."""
         if self._last_failure_time is None:
             return True
-        return time.time() - self._last_failure_time >= self.config.timeout
+        return now - self._last_failure_time >= self.config.timeout
 
     def _transition_to(self, new_state: CircuitState) -> None:
         """Transition to a new state."""
@@ -155,7 +175,7 @@ class CircuitBreaker(Generic[T]):
         self._state = new_state
         self._stats.state_changes += 1
 
-        if new_state == CircuitState.HALF_OPEN:
+        if new_state is _HALF_OPEN:
             self._half_open_successes = 0
 
         logger.info(
@@ -170,17 +190,18 @@ class CircuitBreaker(Generic[T]):
             },
         )
 
-    def _clean_old_failures(self) -> None:
-        """Remove failures outside the time window."""
-        now = time.time()
-        window_start = now - self.config.window_size
-        while self._failures and self._failures[0].timestamp < window_start:
-            self._failures.popleft()
+    def _window_is_full(self, now: float) -> bool:
+        """Check if failure_threshold failures fall within the time window.
 
-    def _count_recent_failures(self) -> int:
-        """Count failures within the time window."""
-        self._clean_old_failures()
-        return len(self._failures)
+        The failure deque holds at most failure_threshold timestamps, so the
+        threshold is reached exactly when it is full and its oldest entry is
+        still inside the window. No entries need to be scanned or removed.
+        """
+        failures = self._failures
+        return (
+            len(failures) >= self.config.failure_threshold
+            and failures[0] >= now - self.config.window_size
+        )
 
     def allow_request(self) -> bool:
         """Check if a request should be allowed.
@@ -188,46 +209,59 @@ class CircuitBreaker(Generic[T]):
         Returns:
             True if the request should proceed.
         """
-        current_state = self.state  # This may trigger transition
+        # Closed and half-open circuits both allow requests
+        return self._current_state() is not _OPEN
 
-        if current_state == CircuitState.CLOSED:
-            return True
-        elif current_state == CircuitState.HALF_OPEN:
-            # Allow limited requests in half-open
-            return True
-        else:  # OPEN
-            return False
+    def enter(self) -> None:
+        """Admit a request or raise if the circuit is open.
+
+        This is the admission check used by the context manager protocol.
+        Callers that record outcomes themselves call it before each request,
+        then record_success() or record_failure().
+
+        Raises:
+            CircuitBreakerOpenError: If the circuit is open.
+        """
+        if self._state is _CLOSED:
+            return
+
+        now = self._now()
+        if self._current_state(now) is _OPEN:
+            self._stats.rejected_calls += 1
+            raise CircuitBreakerOpenError(self.name, self._time_until_retry(now))
 
     def record_success(self) -> None:
         """Record a successful call."""
         self._stats.total_calls += 1
         self._stats.successful_calls += 1
 
-        if self._state == CircuitState.HALF_OPEN:
+        if self._state is _HALF_OPEN:
             self._half_open_successes += 1
             if self._half_open_successes >= self.config.success_threshold:
-                self._transition_to(CircuitState.CLOSED)
+                self._transition_to(_CLOSED)
                 self._failures.clear()
 
     def record_failure(self, exception: Exception) -> None:
         """Record a failed call.
 
+        Only the time of the failure is kept, not the exception itself.
+
         Args:
             exception: The exception that occurred.
         """
         self._stats.total_calls += 1
         self._stats.failed_calls += 1
 
-        now = time.time()
-        self._failures.append(FailureRecord(timestamp=now, exception=exception))
+        now = self._now()
+        self._failures.append(now)
         self._last_failure_time = now
 
-        if self._state == CircuitState.HALF_OPEN:
+        if self._state is _HALF_OPEN:
             # Immediate trip back to open on failure in half-open
-            self._transition_to(CircuitState.OPEN)
-        elif self._state == CircuitState.CLOSED:
-            if self._count_recent_failures() >= self.config.failure_threshold:
-                self._transition_to(CircuitState.OPEN)
+            self._transition_to(_OPEN)
+        elif self._state is _CLOSED:
+            if self._window_is_full(now):
+                self._transition_to(_OPEN)
 
     def get_time_until_retry(self) -> float:
         """Get seconds until retry is allowed.
@@ -235,32 +269,33 @@ class CircuitBreaker(Generic[T]):
         Returns:
             Seconds until retry, 0 if allowed now.
         """
-        if self._state != CircuitState.OPEN:
+        if self._state is not _OPEN:
             return 0.0
 
+        return self._time_until_retry(self._now())
+
+    def _time_until_retry(self, now: float) -> float:
+        """Get seconds until retry is allowed, as of the given time."""
         if self._last_failure_time is None:
             return 0.0
 
-        elapsed = time.time() - self._last_failure_time
+        elapsed = now - self._last_failure_time
         remaining = self.config.timeout - elapsed
         return max(0.0, remaining)
 
     def reset(self) -> None:
         """Force reset the circuit breaker to closed state."""
-        self._state = CircuitState.CLOSED
+        self._state = _CLOSED
         self._failures.clear()
         self._last_failure_time = None
         self._half_open_successes = 0
 
     async def __aenter__(self) -> CircuitBreaker[T]:
-        """Async context manager entry."""
-        if not self.allow_request():
-            self._stats.rejected_calls += 1
-            raise CircuitBreakerOpenError(
-                self.name,
-                self.get_time_until_retry(),
-            )
-        return self
+        """Async context manager entry.
+
+        Nothing here awaits, so this shares the synchronous entry path.
+        """
+        return self.__enter__()
 
     async def __aexit__(
         self,
@@ -269,19 +304,11 @@ class CircuitBreaker(Generic[T]):
         exc_tb: Any,
     ) -> None:
         """Async context manager exit."""
-        if exc_val is None:
-            self.record_success()
-        elif isinstance(exc_val, Exception):
-            self.record_failure(exc_val)
+        self.__exit__(exc_type, exc_val, exc_tb)
 
     def __enter__(self) -> CircuitBreaker[T]:
         """Sync context manager entry."""
-        if not self.allow_request():
-            self._stats.rejected_calls += 1
-            raise CircuitBreakerOpenError(
-                self.name,
-                self.get_time_until_retry(),
-            )
+        self.enter()
         return self
 
     def __exit__(
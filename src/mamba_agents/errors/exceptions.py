@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
+import re
 from typing import Any
 
+# Tool argument names whose values are redacted from error details
+_SENSITIVE_KEY_RE = re.compile(r"key|secret|token|password|auth", re.IGNORECASE)
+
 
 class AgentError(Exception):
     """Base exception for all agent errors.
 
     All custom exceptions in this framework inherit from this class,
     allowing for easy catching of all agent-related errors.
+
+    Error attributes are stored in ``__slots__``, which makes errors
+    cheaper to create when many are raised, such as during rate limiting.
     """
 
+    __slots__ = ("cause", "details", "message")
+
     def __init__(
         self,
         message: str,
@@ -31,6 +40,19 @@ class AgentError(Exception):
         self.details = details or {}
         self.cause = cause
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Support pickling and copying with attributes stored in slots.
+
+        Returns:
+            Reduce tuple whose state includes every slot attribute.
+        """
+        state = dict(getattr(self, "__dict__", None) or {})
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return (type(self), self.args, state)
+
     def __str__(self) -> str:
         """Return string representation."""
         if self.cause:
@@ -45,6 +67,8 @@ class ConfigurationError(AgentError):
     or contains incompatible settings.
     """
 
+    __slots__ = ("actual", "config_key", "expected")
+
     def __init__(
         self,
         message: str,
@@ -84,6 +108,8 @@ class ModelBackendError(AgentError):
     times out, or is unavailable.
     """
 
+    __slots__ = ("model", "response_body", "retryable", "status_code")
+
     def __init__(
         self,
         message: str,
@@ -127,6 +153,8 @@ class ToolExecutionError(AgentError):
     invalid arguments, permission issues, or runtime errors.
     """
 
+    __slots__ = ("tool_args", "tool_name")
+
     def __init__(
         self,
         message: str,
@@ -149,8 +177,7 @@ class ToolExecutionError(AgentError):
         if tool_args:
             # Redact potentially sensitive values
             details["tool_args"] = {
-                k: "[REDACTED]" if "key" in k.lower() or "secret" in k.lower() else v
-                for k, v in tool_args.items()
+                k: "[REDACTED]" if _SENSITIVE_KEY_RE.search(k) else v for k, v in tool_args.items()
             }
 
         super().__init__(message, details=details, **kwargs)
@@ -165,6 +192,8 @@ class ContextOverflowError(AgentError):
     maximum context window and cannot be compacted further.
     """
 
+    __slots__ = ("compaction_attempted", "current_tokens", "max_tokens")
+
     def __init__(
         self,
         message: str,
@@ -203,6 +232,8 @@ class MCPError(AgentError):
     the server returns an error, or authentication fails.
     """
 
+    __slots__ = ("server_name", "server_url")
+
     def __init__(
         self,
         message: str,
@@ -236,6 +267,8 @@ class RateLimitError(ModelBackendError):
     Raised when the model API rate limit is hit.
     """
 
+    __slots__ = ("retry_after",)
+
     def __init__(
         self,
         message: str,
@@ -264,7 +297,7 @@ class AuthenticationError(AgentError):
     invalid or expired credentials.
     """
 
-    pass
+    __slots__ = ()
 
 
 class TimeoutError(AgentError):
@@ -273,6 +306,8 @@ class TimeoutError(AgentError):
     Raised when an operation exceeds its timeout limit.
     """
 
+    __slots__ = ("operation", "timeout_seconds")
+
     def __init__(
         self,
         message: str,
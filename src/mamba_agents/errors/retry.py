@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import logging
+import random
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Any, TypeVar
 
 from tenacity import (
@@ -14,8 +16,10 @@ from tenacity import (
     wait_exponential,
     wait_random_exponential,
 )
+from tenacity.wait import wait_base as WaitStrategy
 
-from mamba_agents.config.retry import ErrorRecoveryConfig
+from mamba_agents.config.retry import ErrorRecoveryConfig, RetryJitter
+from mamba_agents.errors.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
 from mamba_agents.errors.exceptions import (
     AgentError,
     ModelBackendError,
@@ -45,32 +49,187 @@ def _log_retry_attempt(retry_state: RetryCallState) -> None:
     )
 
 
+def _always_retry(exception: BaseException) -> bool:
+    """Retry verdict for exceptions that are always retried."""
+    return True
+
+
+def _never_retry(exception: BaseException) -> bool:
+    """Retry verdict for exceptions that are never retried."""
+    return False
+
+
+def _retry_if_retryable(exception: BaseException) -> bool:
+    """Retry verdict for model backend errors, which say whether they are retryable."""
+    return exception.retryable  # type: ignore[attr-defined]
+
+
+# Retry rules checked in order; the first matching exception type decides
+_RETRY_RULES: tuple[
+    tuple[type[BaseException] | tuple[type[BaseException], ...], Callable[[BaseException], bool]],
+    ...,
+] = (
+    # Always retry rate limit errors
+    (RateLimitError, _always_retry),
+    # Retry ModelBackendError if marked as retryable
+    (ModelBackendError, _retry_if_retryable),
+    # Don't retry other AgentErrors by default
+    (AgentError, _never_retry),
+    # Retry connection and timeout errors
+    ((ConnectionError, TimeoutError), _always_retry),
+)
+
+# Retry verdict per concrete exception type, filled in on first sight
+_retry_verdicts: dict[type[BaseException], Callable[[BaseException], bool]] = {}
+
+
 def _should_retry(exception: BaseException) -> bool:
     """Determine if an exception should trigger a retry.
 
+    The matching rule is looked up once per exception type and then
+    cached, so repeated failures cost a single dict lookup.
+
     Args:
         exception: The exception to check.
 
     Returns:
         True if the exception should trigger a retry.
     """
-    # Always retry rate limit errors
-    if isinstance(exception, RateLimitError):
-        return True
+    exc_type = type(exception)
+    verdict = _retry_verdicts.get(exc_type)
+    if verdict is None:
+        verdict = next(
+            (rule for types, rule in _RETRY_RULES if issubclass(exc_type, types)),
+            _never_retry,
+        )
+        _retry_verdicts[exc_type] = verdict
+    return verdict(exception)
+
+
+class _DecorrelatedJitterWait(WaitStrategy):
+    """Wait a random time based on the previous wait ("decorrelated jitter").
+
+    Each wait is drawn uniformly between the base wait and three times the
+    previous wait, capped at the maximum. Compared with full jitter, waits
+    stay spread out while still growing after repeated failures.
+    """
 
-    # Retry ModelBackendError if marked as retryable
-    if isinstance(exception, ModelBackendError):
-        return exception.retryable
+    def __init__(self, multiplier: float = 1.0, max: float = 60.0) -> None:
+        """Initialize the wait strategy.
 
-    # Don't retry other AgentErrors by default
-    if isinstance(exception, AgentError):
+        Args:
+            multiplier: Base wait time in seconds.
+            max: Maximum wait time in seconds.
+        """
+        self.multiplier = multiplier
+        self.max = max
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        """Get the time to wait before the next attempt.
+
+        Args:
+            retry_state: Current retry state. Its upcoming_sleep still holds
+                the previous wait when this is called.
+
+        Returns:
+            Seconds to wait.
+        """
+        previous = retry_state.upcoming_sleep or self.multiplier
+        return min(self.max, random.uniform(self.multiplier, previous * 3))
+
+
+def _create_wait(jitter: RetryJitter, wait_base: float, wait_max: float) -> WaitStrategy:
+    """Create the wait strategy for a jitter setting.
+
+    Args:
+        jitter: Jitter setting from ErrorRecoveryConfig.
+        wait_base: Base wait time in seconds.
+        wait_max: Maximum wait time in seconds.
+
+    Returns:
+        Tenacity wait strategy.
+    """
+    if jitter == "none":
+        return wait_exponential(multiplier=wait_base, max=wait_max)
+    if jitter == "decorrelated":
+        return _DecorrelatedJitterWait(multiplier=wait_base, max=wait_max)
+    return wait_random_exponential(multiplier=wait_base, max=wait_max)
+
+
+def _retry_predicate(retry_state: RetryCallState) -> bool:
+    """Check if a model call should be retried based on its exception.
+
+    Args:
+        retry_state: Current retry state.
+
+    Returns:
+        True if the call raised an exception that should trigger a retry.
+    """
+    if retry_state.outcome is None:
+        return False
+    exception = retry_state.outcome.exception()
+    if exception is None:
         return False
+    return _should_retry(exception)
 
-    # Retry connection and timeout errors
-    if isinstance(exception, (ConnectionError, TimeoutError)):
-        return True
 
-    return False
+@lru_cache(maxsize=128)
+def _build_retry_decorator(
+    attempts: int,
+    wait_base: float,
+    wait_max: float,
+    retry_exceptions: tuple[type[Exception], ...],
+    jitter: RetryJitter,
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Build the retry decorator for resolved settings.
+
+    Decorators are cached by their settings, so a retry policy is only
+    built once however many operations use it.
+
+    Args:
+        attempts: Maximum number of attempts.
+        wait_base: Base wait time in seconds.
+        wait_max: Maximum wait time in seconds.
+        retry_exceptions: Exceptions to retry on.
+        jitter: Backoff jitter setting.
+
+    Returns:
+        Retry decorator.
+    """
+    return retry(
+        stop=stop_after_attempt(attempts),
+        wait=_create_wait(jitter, wait_base, wait_max),
+        retry=retry_if_exception_type(retry_exceptions),
+        before_sleep=_log_retry_attempt,
+        reraise=True,
+    )
+
+
+@lru_cache(maxsize=128)
+def _build_model_retry_decorator(
+    max_retries: int,
+    base_delay: float,
+    max_delay: float,
+    jitter: RetryJitter,
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Build the model call retry decorator for resolved settings.
+
+    Args:
+        max_retries: Number of retries after the first attempt.
+        base_delay: Base wait time in seconds.
+        max_delay: Maximum wait time in seconds.
+        jitter: Backoff jitter setting.
+
+    Returns:
+        Retry decorator for model calls.
+    """
+    return retry(
+        stop=stop_after_attempt(max_retries + 1),
+        wait=_create_wait(jitter, base_delay, max_delay),
+        retry=_retry_predicate,
+        before_sleep=_log_retry_attempt,
+        reraise=True,
+    )
 
 
 def create_retry_decorator(
@@ -80,15 +239,21 @@ def create_retry_decorator(
     base_wait: float | None = None,
     max_wait: float | None = None,
     retry_exceptions: tuple[type[Exception], ...] | None = None,
+    jitter: RetryJitter | None = None,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """Create a retry decorator with the given configuration.
 
+    Waits grow exponentially and are randomized according to the jitter
+    setting ("full" by default), so clients that fail together do not
+    all retry at the same moment.
+
     Args:
         config: Error recovery configuration.
         max_attempts: Override max retry attempts.
         base_wait: Override base wait time in seconds.
         max_wait: Override max wait time in seconds.
         retry_exceptions: Override exceptions to retry on.
+        jitter: Override backoff jitter ("none", "full" or "decorrelated").
 
     Returns:
         Retry decorator.
@@ -97,20 +262,20 @@ def create_retry_decorator(
         config = ErrorRecoveryConfig()
 
     # Use overrides or config values
-    attempts = max_attempts if max_attempts is not None else config.max_retries + 1
-    wait_base = base_wait if base_wait is not None else config.base_retry_delay
-    wait_max = max_wait if max_wait is not None else config.max_retry_delay
+    attempts = max_attempts if max_attempts is not None else config.get_tool_retries() + 1
+    wait_base = base_wait if base_wait is not None else config.initial_backoff_seconds
+    wait_max = max_wait if max_wait is not None else config.max_backoff_seconds
 
     # Default retry exceptions if not specified
     if retry_exceptions is None:
         retry_exceptions = (RateLimitError, ConnectionError, TimeoutError)
 
-    return retry(
-        stop=stop_after_attempt(attempts),
-        wait=wait_exponential(multiplier=wait_base, max=wait_max),
-        retry=retry_if_exception_type(retry_exceptions),
-        before_sleep=_log_retry_attempt,
-        reraise=True,
+    return _build_retry_decorator(
+        attempts,
+        wait_base,
+        wait_max,
+        retry_exceptions,
+        jitter if jitter is not None else config.jitter,
     )
 
 
@@ -119,7 +284,8 @@ def create_model_retry_decorator(
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """Create a retry decorator specifically for model API calls.
 
-    Uses random exponential backoff to avoid thundering herd problems.
+    Uses randomized exponential backoff (the config's jitter setting) to
+    avoid thundering herd problems.
 
     Args:
         config: Error recovery configuration.
@@ -130,45 +296,63 @@ def create_model_retry_decorator(
     if config is None:
         config = ErrorRecoveryConfig()
 
-    def retry_predicate(retry_state: RetryCallState) -> bool:
-        """Check if we should retry based on the exception."""
-        if retry_state.outcome is None:
-            return False
-        exception = retry_state.outcome.exception()
-        if exception is None:
-            return False
-        return _should_retry(exception)
-
-    return retry(
-        stop=stop_after_attempt(config.max_retries + 1),
-        wait=wait_random_exponential(
-            multiplier=config.base_retry_delay,
-            max=config.max_retry_delay,
-        ),
-        retry=retry_predicate,
-        before_sleep=_log_retry_attempt,
-        reraise=True,
+    return _build_model_retry_decorator(
+        config.get_model_retries(),
+        config.initial_backoff_seconds,
+        config.max_backoff_seconds,
+        config.jitter,
     )
 
 
 class RetryContext:
-    """Context manager for retry operations with metrics."""
+    """Context manager for retry operations with metrics.
+
+    Attempts go through a circuit breaker. Once circuit_breaker_threshold
+    attempts have failed with transient errors within the breaker's window,
+    calls fail fast with CircuitBreakerOpenError instead of running the retry
+    schedule, until circuit_breaker_timeout has passed. Errors that are never
+    retried, such as invalid arguments, do not count towards the threshold.
+
+    The breaker belongs to the context, so reuse one context for repeated
+    calls to the same operation, or pass one breaker to several contexts to
+    share its state between them.
+    """
 
     def __init__(
         self,
         operation_name: str,
         config: ErrorRecoveryConfig | None = None,
+        *,
+        circuit_breaker: CircuitBreaker[Any] | None = None,
     ) -> None:
         """Initialize retry context.
 
         Args:
             operation_name: Name of the operation being retried.
             config: Error recovery configuration.
+            circuit_breaker: Circuit breaker to share with other contexts. If
+                None, the context creates its own from the config.
         """
         self.operation_name = operation_name
         self.config = config or ErrorRecoveryConfig()
         self.attempts = 0
         self.last_exception: Exception | None = None
+        if circuit_breaker is None:
+            circuit_breaker = CircuitBreaker(
+                operation_name,
+                CircuitBreakerConfig(
+                    failure_threshold=self.config.circuit_breaker_threshold,
+                    timeout=self.config.circuit_breaker_timeout,
+                ),
+            )
+        self._circuit_breaker = circuit_breaker
+        # Wrapped once here rather than on every execute() call
+        self._attempt_with_retry = create_retry_decorator(self.config)(self._attempt)
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker[Any]:
+        """Get the circuit breaker guarding this context's attempts."""
+        return self._circuit_breaker
 
     async def execute(
         self,
@@ -187,20 +371,45 @@ class RetryContext:
             Function result.
 
         Raises:
+            CircuitBreakerOpenError: If the operation's circuit is open.
             Exception: If all retries are exhausted.
         """
-        decorator = create_retry_decorator(self.config)
-
-        @decorator
-        async def wrapped() -> Any:
-            self.attempts += 1
-            try:
-                return await func(*args, **kwargs)
-            except Exception as e:
-                self.last_exception = e
-                raise
-
-        return await wrapped()
+        return await self._attempt_with_retry(func, *args, **kwargs)
+
+    async def _attempt(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """Run a single attempt, recording it.
+
+        Args:
+            func: Async function to execute.
+            *args: Positional arguments.
+            **kwargs: Keyword arguments.
+
+        Returns:
+            Function result.
+
+        Raises:
+            CircuitBreakerOpenError: If the operation's circuit is open. It is
+                not retried.
+        """
+        breaker = self._circuit_breaker
+        breaker.enter()
+
+        self.attempts += 1
+        try:
+            result = await func(*args, **kwargs)
+        except Exception as e:
+            self.last_exception = e
+            # Only transient failures say anything about the backend's health
+            if _should_retry(e):
+                breaker.record_failure(e)
+            raise
+        breaker.record_success()
+        return result
 
     def __enter__(self) -> RetryContext:
         """Enter context."""
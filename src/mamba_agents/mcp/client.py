@@ -11,9 +11,62 @@ from mamba_agents.mcp.config import MCPServerConfig
 from mamba_agents.mcp.env import resolve_server_env
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
     from pydantic_ai.mcp import MCPServer
 
 
+def _build_stdio_server(config: MCPServerConfig) -> MCPServer:
+    """Create a stdio MCP server from configuration.
+
+    Args:
+        config: Server configuration.
+
+    Returns:
+        MCPServerStdio instance.
+
+    Raises:
+        ValueError: If no command is configured.
+    """
+    if not config.command:
+        raise ValueError(f"Command required for stdio transport: {config.name}")
+
+    env = resolve_server_env(config)
+    return MCPServerStdio(
+        config.command,
+        args=config.args,
+        env=env,
+        tool_prefix=config.tool_prefix,
+    )
+
+
+def _build_sse_server(config: MCPServerConfig) -> MCPServer:
+    """Create an SSE MCP server from configuration.
+
+    Args:
+        config: Server configuration.
+
+    Returns:
+        MCPServerSSE instance.
+
+    Raises:
+        ValueError: If no URL is configured.
+    """
+    if not config.url:
+        raise ValueError(f"URL required for SSE transport: {config.name}")
+
+    # No headers dict is built for servers without authentication
+    headers = build_auth_headers(config.auth) if config.auth else None
+    return MCPServerSSE(config.url, headers=headers, tool_prefix=config.tool_prefix)
+
+
+# Server factory for each supported transport
+_TRANSPORT_BUILDERS: dict[str, Callable[[MCPServerConfig], MCPServer]] = {
+    "stdio": _build_stdio_server,
+    "sse": _build_sse_server,
+}
+
+
 class MCPClientManager:
     """Manages MCP server configurations and creates toolsets for pydantic-ai Agent.
 
@@ -42,7 +95,12 @@ class MCPClientManager:
         Args:
             configs: Optional list of server configurations.
         """
-        self._configs = configs or []
+        self._configs = list(configs) if configs else []
+        # Read-only snapshot returned by the configs property, rebuilt after changes
+        self._configs_snapshot: tuple[MCPServerConfig, ...] | None = None
+        # Servers already built by as_toolsets(), keyed by id() of their config.
+        # Entries keep the config so an id is never matched to a different object.
+        self._servers: dict[int, tuple[MCPServerConfig, MCPServer]] = {}
 
     def add_server(self, config: MCPServerConfig) -> None:
         """Add a server configuration.
@@ -51,6 +109,7 @@ class MCPClientManager:
             config: Server configuration to add.
         """
         self._configs.append(config)
+        self._configs_snapshot = None
 
     def as_toolsets(self) -> list[MCPServer]:
         """Get MCP servers as toolsets for pydantic-ai Agent.
@@ -59,6 +118,11 @@ class MCPClientManager:
         be passed to Agent via the `toolsets` parameter. pydantic-ai handles
         server lifecycle automatically (connection on first use, cleanup on exit).
 
+        Each server is built once per configuration, so later calls (for
+        example when constructing several agents) return the same instances
+        and do not resolve environment variables or auth headers again.
+        Configurations should not be modified after their server is built.
+
         Returns:
             List of MCPServer instances to pass to Agent(toolsets=...).
 
@@ -66,11 +130,14 @@ class MCPClientManager:
             >>> manager = MCPClientManager(configs)
             >>> agent = Agent("gpt-4o", toolsets=manager.as_toolsets())
         """
-        servers: list[MCPServer] = []
+        servers = self._servers
+        toolsets: list[MCPServer] = []
         for config in self._configs:
-            server = self._create_server(config)
-            servers.append(server)
-        return servers
+            entry = servers.get(id(config))
+            if entry is None or entry[0] is not config:
+                entry = servers[id(config)] = (config, self._create_server(config))
+            toolsets.append(entry[1])
+        return toolsets
 
     def _create_server(self, config: MCPServerConfig) -> MCPServer:
         """Create an MCP server instance from configuration.
@@ -84,30 +151,21 @@ class MCPClientManager:
         Raises:
             ValueError: If configuration is invalid.
         """
-        if config.transport == "stdio":
-            if not config.command:
-                raise ValueError(f"Command required for stdio transport: {config.name}")
-
-            env = resolve_server_env(config)
-            return MCPServerStdio(
-                config.command,
-                args=config.args,
-                env=env,
-                tool_prefix=config.tool_prefix,
-            )
-        elif config.transport == "sse":
-            if not config.url:
-                raise ValueError(f"URL required for SSE transport: {config.name}")
-
-            headers = {}
-            if config.auth:
-                headers = build_auth_headers(config.auth)
-
-            return MCPServerSSE(config.url, headers=headers, tool_prefix=config.tool_prefix)
-        else:
-            raise ValueError(f"Unknown transport: {config.transport}")
+        try:
+            build = _TRANSPORT_BUILDERS[config.transport]
+        except KeyError:
+            raise ValueError(f"Unknown transport: {config.transport}") from None
+        return build(config)
 
     @property
-    def configs(self) -> list[MCPServerConfig]:
-        """Get all server configurations."""
-        return self._configs.copy()
+    def configs(self) -> Sequence[MCPServerConfig]:
+        """Get all server configurations.
+
+        Returns:
+            Read-only snapshot of the configurations, shared between reads
+            until a server is added.
+        """
+        snapshot = self._configs_snapshot
+        if snapshot is None:
+            snapshot = self._configs_snapshot = tuple(self._configs)
+        return snapshot
@@ -35,6 +35,9 @@ Example:
     'Hello, World!'
 """
 
+from typing import TYPE_CHECKING
+
+from mamba_agents._internal.lazy import lazy_exports
 from mamba_agents.prompts.config import PromptConfig, TemplateConfig
 from mamba_agents.prompts.errors import (
     PromptError,
@@ -42,8 +45,10 @@ from mamba_agents.prompts.errors import (
     TemplateRenderError,
     TemplateValidationError,
 )
-from mamba_agents.prompts.manager import PromptManager
-from mamba_agents.prompts.template import PromptTemplate
+
+if TYPE_CHECKING:
+    from mamba_agents.prompts.manager import PromptManager
+    from mamba_agents.prompts.template import PromptTemplate
 
 __all__ = [
     "PromptConfig",
@@ -55,3 +60,10 @@ __all__ = [
     "TemplateRenderError",
     "TemplateValidationError",
 ]
+
+_LAZY_EXPORTS: dict[str, str] = {
+    "PromptManager": "mamba_agents.prompts.manager",
+    "PromptTemplate": "mamba_agents.prompts.template",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_EXPORTS)
@@ -1,8 +1,21 @@
 """Token management and tracking."""
 
+from typing import TYPE_CHECKING
+
+from mamba_agents._internal.lazy import lazy_exports
 from mamba_agents.tokens.config import TokenizerConfig
-from mamba_agents.tokens.cost import CostEstimator
-from mamba_agents.tokens.counter import TokenCounter
-from mamba_agents.tokens.tracker import UsageTracker
+
+if TYPE_CHECKING:
+    from mamba_agents.tokens.cost import CostEstimator
+    from mamba_agents.tokens.counter import TokenCounter
+    from mamba_agents.tokens.tracker import UsageTracker
 
 __all__ = ["CostEstimator", "TokenCounter", "TokenizerConfig", "UsageTracker"]
+
+_LAZY_EXPORTS: dict[str, str] = {
+    "CostEstimator": "mamba_agents.tokens.cost",
+    "TokenCounter": "mamba_agents.tokens.counter",
+    "UsageTracker": "mamba_agents.tokens.tracker",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_EXPORTS)
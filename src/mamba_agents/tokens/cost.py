@@ -61,13 +61,28 @@ class CostEstimator:
             custom_rates: Custom cost rates per 1000 tokens.
                           Overrides defaults for specified models.
         """
-        self._rates = DEFAULT_COST_RATES.copy()
-        if custom_rates:
-            self._rates.update(custom_rates)
+        # The default table is shared until rates are customized (copy-on-write)
+        self._rates = {**DEFAULT_COST_RATES, **custom_rates} if custom_rates else DEFAULT_COST_RATES
+        # Resolved rate per requested model name, cleared whenever rates change
+        self._rate_cache: dict[str, float] = {}
 
     def get_rate(self, model: str) -> float:
         """Get the cost rate for a model.
 
+        Args:
+            model: Model name or identifier.
+
+        Returns:
+            Cost per 1000 tokens.
+        """
+        rate = self._rate_cache.get(model)
+        if rate is None:
+            rate = self._rate_cache[model] = self._resolve_rate(model)
+        return rate
+
+    def _resolve_rate(self, model: str) -> float:
+        """Resolve the rate for a model by exact, then substring, match.
+
         Args:
             model: Model name or identifier.
 
@@ -138,7 +153,10 @@ class CostEstimator:
             model: Model name.
             rate: Cost per 1000 tokens.
         """
+        if self._rates is DEFAULT_COST_RATES:
+            self._rates = DEFAULT_COST_RATES.copy()
         self._rates[model] = rate
+        self._rate_cache.clear()
 
     def get_all_rates(self) -> dict[str, float]:
         """Get all configured rates.
@@ -8,9 +8,19 @@ from typing import TYPE_CHECKING, Any
 import tiktoken
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from mamba_agents.tokens.config import TokenizerConfig
 
 
+# Approximate overhead per message (role, separators)
+MESSAGE_OVERHEAD_TOKENS = 4
+# Approximate overhead per tool call in an assistant message
+TOOL_CALL_OVERHEAD_TOKENS = 10
+# Approximate overhead added once per message list
+LIST_OVERHEAD_TOKENS = 3
+
+
 @lru_cache(maxsize=10)
 def _get_encoding(encoding_name: str) -> tiktoken.Encoding:
     """Get a cached tiktoken encoding.
@@ -56,49 +66,63 @@ class TokenCounter:
         Returns:
             Approximate token count.
         """
-        return len(self._encoding.encode(text))
+        # encode_ordinary skips special-token checks, so text that happens to
+        # contain strings like "<|endoftext|>" is counted instead of rejected
+        return len(self._encoding.encode_ordinary(text))
+
+    def count_message(self, message: dict[str, Any]) -> int:
+        """Count tokens in a single chat message.
+
+        Includes the per-message structure overhead but not the one-off
+        overhead that count_messages() adds for the whole list.
+
+        Args:
+            message: Message dictionary with 'role' and 'content'.
+
+        Returns:
+            Approximate token count for the message.
+        """
+        # Add overhead per message (role, separators)
+        total = MESSAGE_OVERHEAD_TOKENS
+
+        # Count content tokens
+        content = message.get("content", "")
+        if content:
+            total += self.count(content)
+
+        # Count role tokens
+        role = message.get("role", "")
+        if role:
+            total += self.count(role)
+
+        # Count tool call tokens if present
+        tool_calls = message.get("tool_calls", [])
+        for tool_call in tool_calls:
+            if isinstance(tool_call, dict):
+                func = tool_call.get("function", {})
+                name = func.get("name", "")
+                args = func.get("arguments", "")
+                total += self.count(name) + self.count(args) + TOOL_CALL_OVERHEAD_TOKENS
 
-    def count_messages(self, messages: list[dict[str, Any]]) -> int:
+        return total
+
+    def count_messages(self, messages: Iterable[dict[str, Any]]) -> int:
         """Count tokens in a message list.
 
         Estimates tokens for a list of chat messages, accounting for
         message structure overhead.
 
         Args:
-            messages: List of message dictionaries with 'role' and 'content'.
+            messages: Message dictionaries with 'role' and 'content'. Any
+                iterable is accepted and consumed once.
 
         Returns:
             Approximate total token count.
         """
-        total = 0
-
-        for message in messages:
-            # Add overhead per message (role, separators)
-            total += 4  # Approximate overhead per message
-
-            # Count content tokens
-            content = message.get("content", "")
-            if content:
-                total += self.count(content)
-
-            # Count role tokens
-            role = message.get("role", "")
-            if role:
-                total += self.count(role)
-
-            # Count tool call tokens if present
-            tool_calls = message.get("tool_calls", [])
-            for tool_call in tool_calls:
-                if isinstance(tool_call, dict):
-                    func = tool_call.get("function", {})
-                    name = func.get("name", "")
-                    args = func.get("arguments", "")
-                    total += self.count(name) + self.count(args) + 10  # Overhead
+        total = sum(self.count_message(message) for message in messages)
 
         # Add final overhead
-        total += 3
-
-        return total
+        return total + LIST_OVERHEAD_TOKENS
 
     def count_with_margin(self, text: str) -> int:
         """Count tokens with safety margin.
@@ -54,20 +54,26 @@ class UsageTracker:
     """Track token usage across requests.
 
     Provides per-request tracking, session aggregates, and cost estimation.
+
+    Attributes:
+        enabled: Whether the agent records run usage into this tracker.
     """
 
     def __init__(
         self,
         cost_rates: dict[str, float] | None = None,
+        enabled: bool = True,
     ) -> None:
         """Initialize the usage tracker.
 
         Args:
             cost_rates: Optional cost per 1000 tokens for different models.
+            enabled: Whether the agent records run usage into this tracker.
         """
         self._records: list[UsageRecord] = []
         self._totals = TokenUsage()
         self._cost_rates = cost_rates or {}
+        self.enabled = enabled
 
     def record_usage(
         self,
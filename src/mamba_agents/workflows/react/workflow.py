@@ -383,23 +383,20 @@ class ReActWorkflow(Workflow[DepsT, str, ReActState]):
         if not self._react_config.auto_compact_in_workflow:
             return
 
-        if self._agent.context_manager is None:
-            return
-
-        # Get current context state
-        try:
-            ctx = self._agent.get_context_state()
-        except RuntimeError:
+        context_manager = self._agent.context_manager
+        if context_manager is None:
             # Context tracking disabled
             return
 
         # Calculate threshold using public config property
-        compaction_config = self._agent.context_manager.config
         threshold = (
-            self._react_config.compact_threshold_ratio * compaction_config.trigger_threshold_tokens
+            self._react_config.compact_threshold_ratio
+            * context_manager.config.trigger_threshold_tokens
         )
 
-        if ctx.token_count >= threshold:
+        # Only the token count is needed, so no full ContextState snapshot
+        # (with its copy of the compaction history) is built per iteration
+        if context_manager.get_token_count() >= threshold:
             compaction_result = await self._agent.compact()
             react_state.compaction_count += 1
 
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import weakref
+
 import pytest
+from pydantic_ai import RunContext
 from pydantic_ai.models.test import TestModel
 
 from mamba_agents import Agent, AgentConfig, CompactionConfig
 from mamba_agents.context import ContextManager
+from mamba_agents.tokens import TokenCounter
 
 
 class TestAgentContextIntegration:
@@ -82,6 +87,154 @@ class TestAgentContextIntegration:
         count = agent.get_token_count("Hello, world!")
         assert count > 0
 
+    def test_token_count_matches_full_recount(self) -> None:
+        """Test that the incrementally maintained token count matches a full recount."""
+        model = TestModel(custom_output_text="Hello!")
+        config = AgentConfig(system_prompt="You are a helpful assistant.")
+        agent: Agent[None, str] = Agent(model, config=config)
+
+        agent.run_sync("First")
+        agent.run_sync("Second")
+
+        counter = agent.token_counter
+        expected = counter.count_messages(agent.get_messages()) + counter.count(
+            "You are a helpful assistant."
+        )
+        assert agent.get_token_count() == expected
+
+    def test_deferred_token_count_matches_full_recount(self) -> None:
+        """Test that lazily counted context tokens match an eager recount."""
+        model = TestModel(custom_output_text="Hello!")
+        config = AgentConfig(auto_compact=False)
+        agent: Agent[None, str] = Agent(model, config=config)
+
+        agent.run_sync("First")
+        agent.run_sync("Second")
+
+        counter = agent.token_counter
+        assert agent.get_token_count() == counter.count_messages(agent.get_messages())
+
+    def test_token_count_after_compaction_matches_full_recount(self) -> None:
+        """Test that token counts carried through compaction match a full recount."""
+        model = TestModel(custom_output_text="Hello!")
+        config = AgentConfig(
+            context=CompactionConfig(
+                trigger_threshold_tokens=20,
+                target_tokens=10,
+                preserve_recent_turns=1,
+            ),
+        )
+        agent: Agent[None, str] = Agent(model, config=config)
+
+        agent.run_sync("First")
+        agent.run_sync("Second")
+
+        assert agent.context_manager.get_compaction_history()
+        counter = agent.token_counter
+        assert agent.get_token_count() == counter.count_messages(agent.get_messages())
+
+    @pytest.mark.asyncio
+    async def test_compaction_reuses_context_token_counts(self) -> None:
+        """Test that compaction counts with the context's counter without re-tokenizing."""
+
+        class RecordingCounter(TokenCounter):
+            def __init__(self) -> None:
+                super().__init__()
+                self.counted: list[dict[str, str]] = []
+
+            def count_message(self, message: dict[str, str]) -> int:
+                self.counted.append(message)
+                return super().count_message(message)
+
+        counter = RecordingCounter()
+        manager = ContextManager(
+            config=CompactionConfig(target_tokens=20, preserve_recent_turns=1),
+            token_counter=counter,
+        )
+        manager.add_messages([{"role": "user", "content": f"message {i}"} for i in range(5)])
+        counter.counted.clear()
+
+        result = await manager.compact()
+
+        assert result.removed_count > 0
+        assert counter.counted == []
+        assert result.tokens_after == counter.count_messages(result.messages)
+
+    @pytest.mark.asyncio
+    async def test_deferred_compaction_counts_each_message_once(self) -> None:
+        """Test that compacting uncounted messages tokenizes each of them only once."""
+
+        class RecordingCounter(TokenCounter):
+            def __init__(self) -> None:
+                super().__init__()
+                self.counted: list[int] = []
+
+            def count_message(self, message: dict[str, str]) -> int:
+                self.counted.append(id(message))
+                return super().count_message(message)
+
+        counter = RecordingCounter()
+        manager = ContextManager(
+            config=CompactionConfig(target_tokens=20, preserve_recent_turns=1),
+            token_counter=counter,
+            defer_tokenize=True,
+        )
+        messages = [{"role": "user", "content": f"message {i}"} for i in range(5)]
+        manager.add_messages(messages)
+
+        await manager.compact()
+
+        assert sorted(counter.counted) == sorted(id(msg) for msg in messages)
+        assert manager.get_token_count() == counter.count_messages(manager.get_messages())
+
+    def test_extend_from_iter_separates_system_messages(self) -> None:
+        """Test that system messages set the prompt and the rest are stored in order."""
+        messages = [
+            {"role": "system", "content": "First prompt."},
+            {"role": "user", "content": "Hi"},
+            {"role": "system", "content": "Second prompt."},
+            {"role": "assistant", "content": "Hello"},
+        ]
+        manager = ContextManager()
+        manager.extend_from_iter(iter(messages))
+
+        assert manager.get_system_prompt() == "Second prompt."
+        assert manager.get_messages() == [messages[1], messages[3]]
+
+        kept = ContextManager(config=CompactionConfig(preserve_system_prompt=False))
+        kept.extend_from_iter(iter(messages))
+        assert kept.get_system_prompt() is None
+        assert kept.get_messages() == messages
+
+    def test_context_managers_share_strategy_instances(self) -> None:
+        """Test that managers configured with the same strategy share one instance."""
+        first = ContextManager(config=CompactionConfig(strategy="hybrid"))
+        second = ContextManager(config=CompactionConfig(strategy="hybrid"))
+        other = ContextManager(config=CompactionConfig(strategy="sliding_window"))
+
+        assert first._strategy is second._strategy
+        assert first._strategy.name == "hybrid"
+        assert other._strategy.name == "sliding_window"
+
+    def test_token_count_tracks_system_prompt_changes(self) -> None:
+        """Test that the cached system prompt count is refreshed when the prompt changes."""
+        counter = TokenCounter()
+        manager = ContextManager(token_counter=counter)
+        manager.set_system_prompt("Short prompt.")
+        assert manager.get_token_count() == counter.count_messages([]) + counter.count(
+            "Short prompt."
+        )
+
+        manager.add_messages([{"role": "system", "content": "A much longer system prompt."}])
+        assert manager.get_token_count() == counter.count_messages([]) + counter.count(
+            "A much longer system prompt."
+        )
+
+    def test_get_token_count_accepts_special_token_text(self, test_model: TestModel) -> None:
+        """Test that text containing special-token markers is counted, not rejected."""
+        agent: Agent[None, str] = Agent(test_model)
+        assert agent.get_token_count("before <|endoftext|> after") > 0
+
     def test_context_manager_property(self, test_model: TestModel) -> None:
         """Test that context_manager property returns the ContextManager instance."""
         agent: Agent[None, str] = Agent(test_model)
@@ -125,6 +278,16 @@ class TestAgentUsageTracking:
         agent2: Agent[None, str] = Agent(test_model, config=config)
         assert agent2.usage_tracker is not None
 
+    def test_track_usage_disabled_skips_recording(self, test_model: TestModel) -> None:
+        """Test that runs are not recorded when usage tracking is disabled."""
+        config = AgentConfig(track_usage=False)
+        agent: Agent[None, str] = Agent(test_model, config=config)
+
+        agent.run_sync("Hello")
+
+        assert agent.usage_tracker.enabled is False
+        assert agent.get_usage().request_count == 0
+
     def test_token_counter_always_initialized(self, test_model: TestModel) -> None:
         """Test that token counter is always initialized."""
         agent: Agent[None, str] = Agent(test_model)
@@ -135,6 +298,22 @@ class TestAgentUsageTracking:
         agent: Agent[None, str] = Agent(test_model)
         assert agent.cost_estimator is not None
 
+    def test_token_counter_shared_between_identical_configs(self, test_model: TestModel) -> None:
+        """Test that agents with the same tokenizer config share one counter."""
+        first: Agent[None, str] = Agent(test_model)
+        second: Agent[None, str] = Agent(test_model)
+        assert first.token_counter is second.token_counter
+
+    def test_cost_rate_overrides_are_per_agent(self, test_model: TestModel) -> None:
+        """Test that set_rate on one agent's estimator does not affect another."""
+        first: Agent[None, str] = Agent(test_model)
+        second: Agent[None, str] = Agent(test_model)
+
+        first.cost_estimator.set_rate("gpt-4", 1.0)
+
+        assert first.cost_estimator.get_rate("gpt-4") == 1.0
+        assert second.cost_estimator.get_rate("gpt-4") == 0.03
+
     def test_get_usage_returns_token_usage(self, test_model: TestModel) -> None:
         """Test that get_usage returns TokenUsage object."""
         agent: Agent[None, str] = Agent(test_model)
@@ -213,6 +392,62 @@ class TestAgentProperties:
         # Should have the model name from settings
         assert agent.model_name == settings.model_backend.model
 
+    def test_agent_uses_slots(self, test_model: TestModel) -> None:
+        """Test that Agent instances have no per-instance __dict__ but stay weakly referenceable."""
+        agent: Agent[None, str] = Agent(test_model)
+
+        assert not hasattr(agent, "__dict__")
+        assert weakref.ref(agent)() is agent
+
+    def test_from_settings_builds_openai_model(self) -> None:
+        """Test that from_settings builds an OpenAI-compatible model from settings."""
+        from pydantic_ai.models.openai import OpenAIChatModel
+
+        from mamba_agents import AgentSettings
+
+        settings = AgentSettings(model_backend={"model": "custom-model"})
+        agent: Agent[None, str] = Agent.from_settings(settings)
+
+        assert isinstance(agent._agent.model, OpenAIChatModel)
+        assert agent._agent.model.model_name == "custom-model"
+        assert agent.model_name == "custom-model"
+
+
+class TestAgentToolRegistration:
+    """Tests for tool registration on Agent."""
+
+    def test_tool_plain_bare_decorator(self, test_model: TestModel) -> None:
+        """Test that tool_plain registers a function used as a bare decorator."""
+        agent: Agent[None, str] = Agent(test_model)
+
+        @agent.tool_plain
+        def double(x: int) -> int:
+            return x * 2
+
+        assert "double" in agent._agent._function_toolset.tools
+
+    def test_tool_plain_decorator_with_options(self, test_model: TestModel) -> None:
+        """Test that name, description and retries are forwarded to pydantic-ai."""
+        agent: Agent[None, str] = Agent(test_model)
+
+        @agent.tool_plain(name="renamed", description="Custom description", retries=3)
+        def double(x: int) -> int:
+            return x * 2
+
+        tool = agent._agent._function_toolset.tools["renamed"]
+        assert tool.description == "Custom description"
+        assert tool.max_retries == 3
+
+    def test_tool_direct_call_returns_function(self, test_model: TestModel) -> None:
+        """Test that tool() called with a function registers and returns it."""
+        agent: Agent[None, str] = Agent(test_model)
+
+        def lookup(ctx: RunContext[None], key: str) -> str:
+            return key
+
+        assert agent.tool(lookup) is lookup
+        assert "lookup" in agent._agent._function_toolset.tools
+
 
 class TestAgentRunIntegration:
     """Tests for run method integration with tracking."""
@@ -325,3 +560,50 @@ class TestAgentRunIntegration:
 
         # Result should succeed
         assert result is not None
+
+    def test_converted_history_reused_until_context_changes(self) -> None:
+        """Test that internal history is only re-converted after the context changes."""
+        model = TestModel(custom_output_text="Hello!")
+        agent: Agent[None, str] = Agent(model)
+        assert agent._resolve_history(None) is None
+        agent.run_sync("First")
+
+        first = agent._resolve_history(None)
+        again = agent._resolve_history(None)
+        assert again is first
+
+        version = agent.context_manager.version
+        agent.run_sync("Second")
+        assert agent.context_manager.version > version
+
+        updated = agent._resolve_history(None)
+        assert updated is not first
+        assert len(updated) > len(first)
+
+    def test_run_sync_auto_compacts_on_shared_loop(self) -> None:
+        """Test that run_sync compacts context without tearing down the event loop."""
+        config = AgentConfig(
+            auto_compact=True,
+            context=CompactionConfig(
+                trigger_threshold_tokens=20,
+                target_tokens=10,
+                preserve_recent_turns=1,
+            ),
+        )
+        agent: Agent[None, str] = Agent(TestModel(custom_output_text="Hello!"), config=config)
+
+        agent.run_sync("First message")
+        agent.run_sync("Second message")
+        agent.run_sync("Third message")
+
+        assert len(agent.context_manager.get_compaction_history()) >= 2
+        assert not asyncio.get_event_loop().is_closed()
+
+    def test_result_usage_and_new_messages_are_memoized(self, test_model: TestModel) -> None:
+        """Test that AgentResult computes usage and new messages only once."""
+        agent: Agent[None, str] = Agent(test_model)
+        result = agent.run_sync("Hello")
+
+        assert result.usage() is result.usage()
+        assert result.new_messages() is result.new_messages()
+        assert not hasattr(result, "__dict__")
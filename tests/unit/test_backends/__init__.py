@@ -0,0 +1 @@
+"""Unit tests for mamba-agents backends."""
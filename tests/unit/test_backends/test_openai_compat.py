@@ -0,0 +1,366 @@
+"""Tests for the OpenAI-compatible backend."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+import httpx
+import pytest
+from pydantic_core import from_json, to_json
+
+from mamba_agents.backends.base import StreamChunk
+from mamba_agents.backends.openai_compat import OpenAICompatibleBackend, _iter_sse_data
+from mamba_agents.errors import AuthenticationError, ModelBackendError, RateLimitError
+
+
+async def _chunks(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def _sse_data(*chunks: bytes) -> list[bytes]:
+    return [data async for data in _iter_sse_data(_chunks(*chunks))]
+
+
+def _backend(
+    handler: Callable[[httpx.Request], httpx.Response], **kwargs: Any
+) -> OpenAICompatibleBackend:
+    """Create a backend whose requests are answered by handler."""
+    return OpenAICompatibleBackend(
+        "gpt-4o",
+        base_url="http://test/v1",
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+def _status_sequence(*statuses: int) -> tuple[Callable[[httpx.Request], httpx.Response], list[int]]:
+    """Create a handler answering with the given statuses in turn, recording them."""
+    remaining = list(statuses)
+    answered: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        answered.append(remaining.pop(0))
+        return httpx.Response(answered[-1])
+
+    return handler, answered
+
+
+def _stream_response(*events: bytes) -> Callable[[httpx.Request], httpx.Response]:
+    """Create a handler answering with the given SSE data events."""
+    body = b"".join(b"data: " + event + b"\n\n" for event in events)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=body, headers={"Content-Type": "text/event-stream"})
+
+    return handler
+
+
+async def _stream(backend: OpenAICompatibleBackend) -> list[StreamChunk]:
+    return [chunk async for chunk in backend.stream([{"role": "user", "content": "Hi"}])]
+
+
+class TestIterSSEData:
+    """Tests for _iter_sse_data."""
+
+    async def test_single_event(self) -> None:
+        """Test extracting the data of a single event."""
+        assert await _sse_data(b'data: {"a": 1}\n\n') == [b'{"a": 1}']
+
+    async def test_chunks_split_mid_line(self) -> None:
+        """Test that lines split across chunks are reassembled."""
+        assert await _sse_data(b"da", b"ta: hel", b"lo\n", b"\ndata: world\n\n") == [
+            b"hello",
+            b"world",
+        ]
+
+    async def test_chunks_split_mid_crlf(self) -> None:
+        """Test that CRLF line endings split across chunks are handled."""
+        assert await _sse_data(b"data: first\r", b"\n\r", b"\ndata: second\r\n\r\n") == [
+            b"first",
+            b"second",
+        ]
+
+    async def test_multi_line_data(self) -> None:
+        """Test that data lines of one event are joined with newlines."""
+        assert await _sse_data(b"data: line one\ndata: line two\ndata:line three\n\n") == [
+            b"line one\nline two\nline three"
+        ]
+
+    async def test_skips_comments_and_other_fields(self) -> None:
+        """Test that comments and non-data fields are ignored."""
+        stream = b": keepalive\nevent: message\nid: 7\nretry: 100\ndata: payload\n\n"
+
+        assert await _sse_data(stream) == [b"payload"]
+
+    async def test_blank_line_terminates_event(self) -> None:
+        """Test that each blank line ends the current event."""
+        assert await _sse_data(b"data: a\n\ndata: b\n\n\n\ndata: c\n\n") == [b"a", b"b", b"c"]
+
+    async def test_events_without_data_are_skipped(self) -> None:
+        """Test that events made only of comments or fields yield nothing."""
+        assert await _sse_data(b": ping\n\nevent: heartbeat\n\n") == []
+
+    async def test_stream_without_trailing_newline(self) -> None:
+        """Test that an unterminated final event is still yielded."""
+        assert await _sse_data(b"data: first\n\ndata: last") == [b"first", b"last"]
+        assert await _sse_data(b"data: one\ndata: two\r") == [b"one\ntwo"]
+
+    async def test_empty_stream(self) -> None:
+        """Test that an empty stream yields nothing."""
+        assert await _sse_data() == []
+        assert await _sse_data(b"") == []
+
+
+class TestStream:
+    """Tests for OpenAICompatibleBackend.stream."""
+
+    async def test_yields_chunks_until_done(self) -> None:
+        """Test that content chunks are yielded and [DONE] ends the stream."""
+        backend = _backend(
+            _stream_response(
+                b'{"choices": [{"delta": {"content": "Hel"}, "finish_reason": null}]}',
+                b'{"choices": [{"delta": {"content": "lo"}, "finish_reason": null}]}',
+                b"[DONE]",
+                b'{"choices": [{"delta": {"content": "ignored"}, "finish_reason": null}]}',
+            )
+        )
+
+        chunks = await _stream(backend)
+
+        assert [chunk.content for chunk in chunks] == ["Hel", "lo", ""]
+        assert [chunk.is_final for chunk in chunks] == [False, False, True]
+
+    async def test_malformed_json_is_logged_and_skipped(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that malformed chunks are skipped with a warning."""
+        backend = _backend(
+            _stream_response(
+                b"{not json",
+                b'{"choices": [{"delta": {"content": "ok"}, "finish_reason": "stop"}]}',
+                b"[DONE]",
+            )
+        )
+
+        with caplog.at_level(logging.WARNING, logger="mamba_agents.backends.openai_compat"):
+            chunks = await _stream(backend)
+
+        assert [chunk.content for chunk in chunks] == ["ok", ""]
+        assert chunks[0].is_final
+        assert "Failed to parse stream chunk" in caplog.text
+        assert "{not json" in caplog.text
+
+    async def test_frame_without_choices_is_skipped_undecoded(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that frames with empty choices are skipped before decoding."""
+        decoded: list[bytes] = []
+
+        def recording_from_json(data: bytes) -> Any:
+            decoded.append(data)
+            return from_json(data)
+
+        monkeypatch.setattr("mamba_agents.backends.openai_compat.from_json", recording_from_json)
+        usage_frame = b'{"id":"1","choices":[],"usage":{"prompt_tokens":3}}'
+        content_frame = b'{"choices": [{"delta": {"content": "ok"}, "finish_reason": null}]}'
+        backend = _backend(_stream_response(usage_frame, content_frame, b"[DONE]"))
+
+        chunks = await _stream(backend)
+
+        assert [chunk.content for chunk in chunks] == ["ok", ""]
+        assert decoded == [content_frame]
+
+    async def test_content_mentioning_empty_choices_is_yielded(self) -> None:
+        """Test that content containing the empty-choices text is still decoded."""
+        content = '{"choices":[]} and "choices":[]'
+        frame = to_json({"choices": [{"delta": {"content": content}, "finish_reason": None}]})
+        backend = _backend(_stream_response(frame, b"[DONE]"))
+
+        chunks = await _stream(backend)
+
+        assert [chunk.content for chunk in chunks] == [content, ""]
+
+
+class TestHealthCheck:
+    """Tests for OpenAICompatibleBackend.health_check."""
+
+    async def test_success_is_cached(self) -> None:
+        """Test that a successful check is reused within the TTL."""
+        handler, answered = _status_sequence(200, 503)
+        backend = _backend(handler, health_check_ttl=60.0)
+
+        assert await backend.health_check() is True
+        assert await backend.health_check() is True
+        assert answered == [200]
+
+    async def test_failure_is_not_cached(self) -> None:
+        """Test that a recovered backend is reported healthy right away."""
+        handler, answered = _status_sequence(503, 200, 500)
+        backend = _backend(handler, health_check_ttl=60.0)
+
+        assert await backend.health_check() is False
+        assert await backend.health_check() is True
+        assert await backend.health_check() is True
+        assert answered == [503, 200]
+
+    async def test_connection_error_is_unhealthy(self) -> None:
+        """Test that an unreachable backend is reported unhealthy."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        assert await _backend(handler).health_check() is False
+
+    async def test_zero_ttl_disables_cache(self) -> None:
+        """Test that a TTL of 0 checks the backend on every call."""
+        handler, answered = _status_sequence(200, 200, 503)
+        backend = _backend(handler, health_check_ttl=0)
+
+        assert await backend.health_check() is True
+        assert await backend.health_check() is True
+        assert await backend.health_check() is False
+        assert answered == [200, 200, 503]
+
+
+class _TrackingTransport(httpx.MockTransport):
+    """Mock transport that records whether it was closed."""
+
+    closed = False
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class TestClose:
+    """Tests for OpenAICompatibleBackend.close."""
+
+    async def test_closes_own_transport(self) -> None:
+        """Test that a backend closes the client and transport it created."""
+        backend = OpenAICompatibleBackend("gpt-4o", base_url="http://test/v1")
+
+        await backend.close()
+
+        assert backend._client.is_closed
+
+    async def test_leaves_shared_transport_open(self) -> None:
+        """Test that closing one backend leaves a shared transport usable."""
+        transport = _TrackingTransport(lambda request: httpx.Response(200))
+        first = OpenAICompatibleBackend("gpt-4o", base_url="http://test/v1", transport=transport)
+        second = OpenAICompatibleBackend(
+            "gpt-4o-mini", base_url="http://test/v1", transport=transport
+        )
+
+        await first.close()
+
+        assert not transport.closed
+        assert await second.health_check() is True
+
+
+def _status_error(status: int, **response_kwargs: Any) -> httpx.HTTPStatusError:
+    """Create the HTTPStatusError raised for a response."""
+    request = httpx.Request("POST", "http://test/v1/chat/completions")
+    response = httpx.Response(status, request=request, **response_kwargs)
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        response.raise_for_status()
+    return exc_info.value
+
+
+class TestHandleHttpError:
+    """Tests for mapping HTTP errors to agent errors."""
+
+    @pytest.fixture
+    def backend(self) -> OpenAICompatibleBackend:
+        """Provide a backend for mapping errors."""
+        return OpenAICompatibleBackend("gpt-4o", base_url="http://test/v1")
+
+    @pytest.mark.parametrize(
+        ("status", "error_type", "retryable"),
+        [
+            (401, AuthenticationError, None),
+            (429, RateLimitError, True),
+            (400, ModelBackendError, False),
+            (404, ModelBackendError, False),
+            (500, ModelBackendError, True),
+            (503, ModelBackendError, True),
+        ],
+    )
+    def test_status_mapping(
+        self,
+        backend: OpenAICompatibleBackend,
+        status: int,
+        error_type: type[Exception],
+        retryable: bool | None,
+    ) -> None:
+        """Test that each status code raises the matching exception."""
+        with pytest.raises(error_type) as exc_info:
+            backend._handle_http_error(_status_error(status, json={}))
+
+        assert type(exc_info.value) is error_type
+        if retryable is not None:
+            assert exc_info.value.retryable is retryable
+            assert exc_info.value.model == "gpt-4o"
+
+    def test_json_error_message(self, backend: OpenAICompatibleBackend) -> None:
+        """Test that the message is read from a JSON error body."""
+        error = _status_error(400, json={"error": {"message": "Invalid model", "type": "x"}})
+
+        with pytest.raises(ModelBackendError) as exc_info:
+            backend._handle_http_error(error)
+
+        assert exc_info.value.message == "API error (400): Invalid model"
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.response_body == "Invalid model"
+        assert exc_info.value.cause is error
+
+    def test_rate_limit_retry_after(self, backend: OpenAICompatibleBackend) -> None:
+        """Test that Retry-After is passed on with the rate limit message."""
+        error = _status_error(
+            429, json={"error": {"message": "Slow down"}}, headers={"Retry-After": "2.5"}
+        )
+
+        with pytest.raises(RateLimitError) as exc_info:
+            backend._handle_http_error(error)
+
+        assert exc_info.value.retry_after == 2.5
+        assert exc_info.value.message == "Rate limit exceeded: Slow down"
+
+    @pytest.mark.parametrize(
+        "response_kwargs",
+        [
+            {"content": b"<html><body>Bad Gateway</body></html>"},
+            {"content": b""},
+            {"json": {"error": "plain string"}},
+            {"json": ["not", "an", "object"]},
+        ],
+        ids=["html", "empty", "string-error", "json-list"],
+    )
+    def test_non_json_body_falls_back_to_error_text(
+        self, backend: OpenAICompatibleBackend, response_kwargs: dict[str, Any]
+    ) -> None:
+        """Test that bodies without an error message use the HTTP error text."""
+        error = _status_error(502, **response_kwargs)
+
+        with pytest.raises(ModelBackendError) as exc_info:
+            backend._handle_http_error(error)
+
+        assert exc_info.value.message == f"API error (502): {error}"
+        assert exc_info.value.retryable is True
+
+    async def test_unread_streaming_body_falls_back_to_error_text(
+        self, backend: OpenAICompatibleBackend
+    ) -> None:
+        """Test that an unread streaming body does not break error handling."""
+        request = httpx.Request("POST", "http://test/v1/chat/completions")
+        response = httpx.Response(
+            500, request=request, stream=httpx.ByteStream(b'{"error": {"message": "x"}}')
+        )
+        with pytest.raises(httpx.HTTPStatusError) as exc_info:
+            response.raise_for_status()
+
+        with pytest.raises(ModelBackendError) as backend_error:
+            backend._handle_http_error(exc_info.value)
+
+        assert backend_error.value.message == f"API error (500): {exc_info.value}"
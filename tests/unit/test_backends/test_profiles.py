@@ -0,0 +1,104 @@
+"""Tests for model profiles."""
+
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+
+from mamba_agents.backends.profiles import (
+    PROFILES,
+    ModelProfile,
+    get_profile,
+    get_profiles_by_provider,
+    register_profile,
+)
+
+
+class TestGetProfile:
+    """Tests for get_profile."""
+
+    def test_exact_match(self) -> None:
+        """Test that a registered name returns its own profile."""
+        assert get_profile("gpt-4o-mini").name == "gpt-4o-mini"
+
+    def test_longest_prefix_wins(self) -> None:
+        """Test that versioned names resolve to the most specific profile."""
+        assert get_profile("gpt-4o-mini-2024-07-18").name == "gpt-4o-mini"
+        assert get_profile("gpt-4o-2024-05-13").name == "gpt-4o"
+
+    def test_unknown_model_uses_default(self) -> None:
+        """Test that unknown models fall back to the default profile."""
+        assert get_profile("unknown-model") is PROFILES["default"]
+
+    def test_registered_profile_matches_prefix(self) -> None:
+        """Test that custom profiles take part in prefix matching."""
+        profile = ModelProfile(
+            name="custom-test-model-with-a-long-name",
+            provider="custom",
+            context_window=4096,
+            max_output_tokens=1024,
+        )
+        register_profile(profile)
+        try:
+            assert get_profile("custom-test-model-with-a-long-name-v2") is profile
+        finally:
+            del PROFILES[profile.name]
+            get_profile.cache_clear()
+
+    def test_register_profile_clears_cache(self) -> None:
+        """Test that registering a profile replaces previously cached lookups."""
+        assert get_profile("cached-test-model-v1") is PROFILES["default"]
+
+        profile = ModelProfile(
+            name="cached-test-model",
+            provider="custom",
+            context_window=4096,
+            max_output_tokens=1024,
+        )
+        register_profile(profile)
+        try:
+            assert get_profile("cached-test-model-v1") is profile
+        finally:
+            del PROFILES[profile.name]
+            get_profile.cache_clear()
+
+
+class TestGetProfilesByProvider:
+    """Tests for get_profiles_by_provider."""
+
+    def test_returns_provider_profiles_in_order(self) -> None:
+        """Test that profiles are grouped by provider in registration order."""
+        names = [p.name for p in get_profiles_by_provider("openai")]
+        assert names == ["gpt-4o", "gpt-4o-mini", "gpt-4-turbo", "gpt-3.5-turbo"]
+        assert get_profiles_by_provider("missing") == []
+
+    def test_reregistering_moves_profile_between_providers(self) -> None:
+        """Test that replacing a profile updates the provider grouping."""
+        first = ModelProfile(
+            name="provider-test-model", provider="first", context_window=1, max_output_tokens=1
+        )
+        second = dataclasses.replace(first, provider="second")
+        register_profile(first)
+        try:
+            register_profile(second)
+            assert get_profiles_by_provider("first") == []
+            assert get_profiles_by_provider("second") == [second]
+        finally:
+            del PROFILES[first.name]
+            get_profile.cache_clear()
+
+
+class TestModelProfile:
+    """Tests for ModelProfile."""
+
+    def test_profile_is_immutable(self) -> None:
+        """Test that shared profiles cannot be modified in place."""
+        profile = get_profile("gpt-4o")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            profile.context_window = 1  # type: ignore[misc]
+
+        derived = dataclasses.replace(profile, context_window=1)
+        assert derived.context_window == 1
+        assert profile.context_window == 128000
@@ -5,8 +5,9 @@ from __future__ import annotations
 from pathlib import Path
 
 import pytest
-from pydantic import SecretStr
+from pydantic import SecretStr, ValidationError
 
+from mamba_agents.agent.config import AgentConfig
 from mamba_agents.config import (
     AgentSettings,
     ErrorRecoveryConfig,
@@ -65,6 +66,11 @@ class TestModelBackendSettings:
         assert settings.api_key is not None
         assert settings.api_key.get_secret_value() == "super-secret"
 
+    def test_get_api_key(self) -> None:
+        """Test that get_api_key unwraps the secret or returns None."""
+        assert ModelBackendSettings().get_api_key() is None
+        assert ModelBackendSettings(api_key="super-secret").get_api_key() == "super-secret"
+
     def test_from_env_variables(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test loading from environment variables."""
         monkeypatch.setenv("MAMBA_MODEL_BACKEND__BASE_URL", "http://env:9000/v1")
@@ -205,6 +211,16 @@ class TestErrorRecoveryConfig:
         assert config.get_tool_retries() == 5
         assert config.get_model_retries() == 10
 
+    def test_jitter_defaults_to_full(self) -> None:
+        """Test that retry waits are randomized by default."""
+        assert ErrorRecoveryConfig().jitter == "full"
+        assert ErrorRecoveryConfig(jitter="decorrelated").jitter == "decorrelated"
+
+    def test_invalid_jitter_rejected(self) -> None:
+        """Test that unknown jitter settings are rejected."""
+        with pytest.raises(ValidationError):
+            ErrorRecoveryConfig(jitter="random")
+
 
 class TestStreamingConfig:
     """Tests for StreamingConfig."""
@@ -285,3 +301,28 @@ class TestAgentSettings:
         assert "api_key" in dumped["model_backend"]
         # The secret value should not appear in plain text when serialized for logging
         assert "secret-value" not in str(dumped)
+
+
+class TestAgentConfig:
+    """Tests for AgentConfig."""
+
+    def test_defaults(self) -> None:
+        """Test default values."""
+        config = AgentConfig()
+
+        assert config.max_iterations == 10
+        assert config.track_context is True
+        assert config.auto_compact is True
+        assert config.track_usage is True
+
+    def test_is_frozen(self) -> None:
+        """Test that config instances cannot be mutated."""
+        config = AgentConfig()
+
+        with pytest.raises(ValidationError):
+            config.max_iterations = 5
+
+    def test_rejects_unknown_fields(self) -> None:
+        """Test that misspelled options are rejected."""
+        with pytest.raises(ValidationError):
+            AgentConfig(auto_compaction=False)
@@ -0,0 +1 @@
+"""Context management tests."""
@@ -0,0 +1,40 @@
+"""Tests for compaction token counting helpers."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from mamba_agents.context.compaction import (
+    count_message_tokens,
+    shared_token_counts,
+    use_token_counter,
+)
+from mamba_agents.tokens import TokenCounter
+
+MESSAGES: list[dict[str, Any]] = [
+    {"role": "user", "content": "Hello there"},
+    {"role": "assistant", "content": "Hi! How can I help you today?"},
+]
+
+
+class TestCountMessageTokens:
+    """Tests for count_message_tokens."""
+
+    def test_counts_each_message(self) -> None:
+        """Test that each message is counted with the active counter."""
+        counter = TokenCounter()
+
+        with use_token_counter(counter):
+            counts = count_message_tokens(MESSAGES)
+
+        assert counts == [counter.count_message(msg) for msg in MESSAGES]
+
+    def test_reuses_shared_counts(self) -> None:
+        """Test that counts known to a shared block are reused by identity."""
+        equal_copy = dict(MESSAGES[0])
+
+        with shared_token_counts([(MESSAGES[0], 99)]):
+            counts = count_message_tokens([MESSAGES[0], equal_copy])
+
+        assert counts[0] == 99
+        assert counts[1] == TokenCounter().count_message(equal_copy)
@@ -0,0 +1,62 @@
+"""Tests for ImportanceScoringStrategy."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from pydantic_ai import Agent
+from pydantic_ai.messages import ModelMessage, ModelResponse, TextPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from mamba_agents.context.compaction.importance import ImportanceScoringStrategy
+from mamba_agents.errors import ModelBackendError, RateLimitError
+
+MESSAGES: list[dict[str, Any]] = [
+    {"role": "user", "content": "Hello"},
+    {"role": "assistant", "content": "Hi there"},
+    {"role": "user", "content": "What's the weather?"},
+]
+
+
+class TestImportanceScoring:
+    """Tests for message scoring."""
+
+    async def test_heuristic_scores_without_agent(self) -> None:
+        """Test that heuristic scoring gives one score per message."""
+        strategy = ImportanceScoringStrategy()
+
+        scores = await strategy._score_messages(MESSAGES)
+
+        assert len(scores) == len(MESSAGES)
+
+    async def test_llm_scores_in_message_order(self) -> None:
+        """Test that LLM scores are returned in message order."""
+        replies = iter(["2", "5", "9"])
+
+        def reply(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+            return ModelResponse(parts=[TextPart(next(replies))])
+
+        strategy = ImportanceScoringStrategy(Agent(FunctionModel(reply)))
+
+        assert await strategy._score_messages(MESSAGES) == [0.2, 0.5, 0.9]
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            ModelBackendError("backend down", status_code=503, retryable=True),
+            RateLimitError("slow down", retry_after=1.0),
+        ],
+    )
+    async def test_scoring_agent_error_propagates(self, error: ModelBackendError) -> None:
+        """Test that a failing scoring agent raises its original exception."""
+
+        def fail(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+            raise error
+
+        strategy = ImportanceScoringStrategy(Agent(FunctionModel(fail)))
+
+        with pytest.raises(type(error)) as exc_info:
+            await strategy._score_messages(MESSAGES)
+
+        assert exc_info.value is error
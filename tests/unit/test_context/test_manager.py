@@ -0,0 +1,80 @@
+"""Tests for ContextManager."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from mamba_agents.context import CompactionConfig, ContextManager
+
+
+def _manager(**kwargs: Any) -> ContextManager:
+    """Create a manager whose history is well over its target size."""
+    manager = ContextManager(
+        CompactionConfig(target_tokens=40, trigger_threshold_tokens=50, preserve_recent_turns=1),
+        **kwargs,
+    )
+    manager.add_messages(
+        [
+            {"role": "user" if i % 2 == 0 else "assistant", "content": f"Message number {i}"}
+            for i in range(20)
+        ]
+    )
+    return manager
+
+
+class TestCompactSync:
+    """Tests for ContextManager.compact_sync."""
+
+    def test_compact_sync(self) -> None:
+        """Test that compact_sync compacts the history."""
+        manager = _manager()
+
+        result = manager.compact_sync()
+
+        assert result.removed_count > 0
+        assert len(manager.get_messages()) == 20 - result.removed_count
+        assert manager.get_token_count() <= 40
+        assert manager.get_compaction_history() == [result]
+
+    def test_compact_sync_repeated_calls(self) -> None:
+        """Test that compact_sync can be called repeatedly on the same thread."""
+        manager = _manager()
+
+        first = manager.compact_sync()
+        second = manager.compact_sync()
+
+        assert first.removed_count > 0
+        assert second.removed_count == 0
+
+    async def test_compact_sync_inside_running_loop(self) -> None:
+        """Test that compact_sync works while an event loop is running."""
+        manager = _manager()
+
+        result = manager.compact_sync()
+
+        assert result.removed_count > 0
+        assert len(manager.get_messages()) == 20 - result.removed_count
+
+
+class TestCompact:
+    """Tests for ContextManager.compact."""
+
+    async def test_compact_with_deferred_tokenizing(self) -> None:
+        """Test that messages not yet tokenized are counted before compacting."""
+        manager = _manager(defer_tokenize=True)
+
+        result = await manager.compact()
+
+        assert result.removed_count > 0
+        assert result.tokens_before == _manager().get_token_count()
+        assert manager.get_token_count() == result.tokens_after
+
+    async def test_compact_rejects_desynced_counts(self) -> None:
+        """Test that counts out of step with the history fail loudly."""
+        manager = _manager()
+        manager._message_counts.append(1)
+
+        with pytest.raises(ValueError):
+            await manager.compact()
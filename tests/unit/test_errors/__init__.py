@@ -0,0 +1 @@
+"""Error handling tests."""
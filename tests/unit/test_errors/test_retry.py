@@ -0,0 +1,391 @@
+"""Tests for retry logic."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pytest
+from tenacity import (
+    RetryCallState,
+    Retrying,
+    stop_after_attempt,
+    wait_exponential,
+    wait_random_exponential,
+)
+
+from mamba_agents.config.retry import ErrorRecoveryConfig, RetryJitter
+from mamba_agents.errors import (
+    CircuitBreakerOpenError,
+    CircuitState,
+    ConfigurationError,
+    MCPError,
+    ModelBackendError,
+    RateLimitError,
+    RetryContext,
+    create_model_retry_decorator,
+    create_retry_decorator,
+)
+from mamba_agents.errors.retry import (
+    _create_wait,
+    _DecorrelatedJitterWait,
+    _retry_verdicts,
+    _should_retry,
+)
+
+
+def _config(**kwargs: Any) -> ErrorRecoveryConfig:
+    """Create a config with a single attempt per call and no waits."""
+    return ErrorRecoveryConfig(
+        tool_max_retries=0,
+        initial_backoff_seconds=0.001,
+        max_backoff_seconds=0.001,
+        **kwargs,
+    )
+
+
+def _raise_connection_error() -> None:
+    raise ConnectionError("backend down")
+
+
+async def _healthy() -> str:
+    return "ok"
+
+
+async def _connection_error() -> str:
+    raise ConnectionError("backend down")
+
+
+async def _value_error() -> str:
+    raise ValueError("bad argument")
+
+
+def _failing(error: Exception, failures: int) -> tuple[Callable[[], Awaitable[str]], list[int]]:
+    """Create a function that raises error for the first failures calls."""
+    calls: list[int] = []
+
+    async def func() -> str:
+        calls.append(1)
+        if len(calls) <= failures:
+            raise error
+        return "ok"
+
+    return func, calls
+
+
+class TestShouldRetry:
+    """Tests for the retry verdict per exception."""
+
+    @pytest.mark.parametrize(
+        ("exception", "expected"),
+        [
+            (RateLimitError("slow down"), True),
+            (ModelBackendError("unavailable", status_code=503, retryable=True), True),
+            (ModelBackendError("bad request", status_code=400), False),
+            (ConfigurationError("bad config"), False),
+            (MCPError("server failed"), False),
+            (ConnectionError("down"), True),
+            (TimeoutError("timed out"), True),
+            (ValueError("unrelated"), False),
+        ],
+    )
+    def test_verdict(self, exception: Exception, expected: bool) -> None:
+        """Test the verdict for each kind of exception."""
+        assert _should_retry(exception) is expected
+
+    @pytest.mark.parametrize(
+        "exception",
+        [
+            RateLimitError("slow down"),
+            ConfigurationError("bad config"),
+            ConnectionError("down"),
+            ValueError("unrelated"),
+        ],
+    )
+    def test_cached_verdict_is_stable(self, exception: Exception) -> None:
+        """Test that a second call for a cached type gives the same verdict."""
+        first = _should_retry(exception)
+
+        assert type(exception) in _retry_verdicts
+        assert _should_retry(exception) is first
+
+    def test_cached_type_still_reads_retryable(self) -> None:
+        """Test that model errors of a cached type are still judged individually."""
+        assert _should_retry(ModelBackendError("unavailable", retryable=True)) is True
+        assert _should_retry(ModelBackendError("bad request", retryable=False)) is False
+        assert _should_retry(ModelBackendError("unavailable", retryable=True)) is True
+
+
+class TestCreateRetryDecorator:
+    """Tests for create_retry_decorator."""
+
+    async def test_builds_from_default_config(self) -> None:
+        """Test building from a default config and retrying transient errors."""
+        decorator = create_retry_decorator(ErrorRecoveryConfig(), base_wait=0.001, max_wait=0.001)
+        func, calls = _failing(ConnectionError("down"), failures=2)
+
+        assert await decorator(func)() == "ok"
+        assert len(calls) == 3
+
+    def test_equal_settings_share_decorator(self) -> None:
+        """Test that equal settings return the same cached decorator."""
+        assert create_retry_decorator() is create_retry_decorator(ErrorRecoveryConfig())
+        assert create_retry_decorator(max_attempts=2) is create_retry_decorator(max_attempts=2)
+        assert create_retry_decorator(max_attempts=2) is not create_retry_decorator(max_attempts=3)
+
+    async def test_max_attempts_override(self) -> None:
+        """Test that max_attempts overrides the config's retry count."""
+        decorator = create_retry_decorator(max_attempts=2, base_wait=0.001, max_wait=0.001)
+        func, calls = _failing(ConnectionError("down"), failures=5)
+
+        with pytest.raises(ConnectionError):
+            await decorator(func)()
+        assert len(calls) == 2
+
+    async def test_retry_exceptions_override(self) -> None:
+        """Test that retry_exceptions replaces the default exception types."""
+        decorator = create_retry_decorator(
+            retry_exceptions=(ValueError,), base_wait=0.001, max_wait=0.001
+        )
+        func, calls = _failing(ValueError("flaky"), failures=1)
+        assert await decorator(func)() == "ok"
+        assert len(calls) == 2
+
+        func, calls = _failing(ConnectionError("down"), failures=1)
+        with pytest.raises(ConnectionError):
+            await decorator(func)()
+        assert len(calls) == 1
+
+
+class TestCreateModelRetryDecorator:
+    """Tests for create_model_retry_decorator."""
+
+    async def test_builds_from_default_config(self) -> None:
+        """Test building from a default config and retrying rate limits."""
+        config = ErrorRecoveryConfig()
+        decorator = create_model_retry_decorator(
+            config.model_copy(
+                update={"initial_backoff_seconds": 0.001, "max_backoff_seconds": 0.001}
+            )
+        )
+        func, calls = _failing(RateLimitError("slow down"), failures=config.get_model_retries())
+
+        assert await decorator(func)() == "ok"
+        assert len(calls) == config.get_model_retries() + 1
+
+    def test_equal_settings_share_decorator(self) -> None:
+        """Test that equal settings return the same cached decorator."""
+        assert create_model_retry_decorator() is create_model_retry_decorator(ErrorRecoveryConfig())
+        assert create_model_retry_decorator(
+            ErrorRecoveryConfig(model_max_retries=1)
+        ) is not create_model_retry_decorator(ErrorRecoveryConfig(model_max_retries=2))
+
+    async def test_model_max_retries_override(self) -> None:
+        """Test that model_max_retries sets the number of retries."""
+        decorator = create_model_retry_decorator(_config(model_max_retries=1))
+        func, calls = _failing(RateLimitError("slow down"), failures=5)
+
+        with pytest.raises(RateLimitError):
+            await decorator(func)()
+        assert len(calls) == 2
+
+    async def test_non_retryable_error_not_retried(self) -> None:
+        """Test that non-retryable model errors fail on the first attempt."""
+        decorator = create_model_retry_decorator(_config())
+        func, calls = _failing(ModelBackendError("bad request", status_code=400), failures=5)
+
+        with pytest.raises(ModelBackendError):
+            await decorator(func)()
+        assert len(calls) == 1
+
+
+class TestCreateWait:
+    """Tests for backoff wait strategies."""
+
+    @pytest.mark.parametrize(
+        ("jitter", "wait_type"),
+        [
+            ("none", wait_exponential),
+            ("full", wait_random_exponential),
+            ("decorrelated", _DecorrelatedJitterWait),
+        ],
+    )
+    def test_maps_jitter_setting(self, jitter: RetryJitter, wait_type: type) -> None:
+        """Test that each jitter setting maps to its wait strategy."""
+        assert type(_create_wait(jitter, 1.0, 60.0)) is wait_type
+
+    def test_default_jitter_is_full(self) -> None:
+        """Test that the default config uses full jitter."""
+        assert ErrorRecoveryConfig().jitter == "full"
+
+    def test_none_is_plain_exponential(self) -> None:
+        """Test that no jitter gives deterministic exponential waits."""
+        wait = _create_wait("none", 1.0, 10.0)
+        state = RetryCallState(retry_object=Retrying(), fn=None, args=(), kwargs={})
+
+        waits = []
+        for attempt in range(1, 6):
+            state.attempt_number = attempt
+            waits.append(wait(state))
+
+        assert waits == [1.0, 2.0, 4.0, 8.0, 10.0]
+
+    def test_full_stays_below_exponential_wait(self) -> None:
+        """Test that full jitter waits stay between zero and the exponential wait."""
+        wait = _create_wait("full", 1.0, 10.0)
+        state = RetryCallState(retry_object=Retrying(), fn=None, args=(), kwargs={})
+
+        for attempt in range(1, 6):
+            state.attempt_number = attempt
+            for _ in range(20):
+                assert 0 <= wait(state) <= min(10.0, 2 ** (attempt - 1))
+
+    def test_decorrelated_bounds_across_attempts(self) -> None:
+        """Test that decorrelated waits stay within [base, min(max, 3 * previous)]."""
+        base, maximum = 0.5, 20.0
+        sleeps: list[float] = []
+        retrying = Retrying(
+            wait=_create_wait("decorrelated", base, maximum),
+            stop=stop_after_attempt(30),
+            sleep=sleeps.append,
+            reraise=True,
+        )
+
+        with pytest.raises(ConnectionError):
+            retrying(_raise_connection_error)
+
+        assert len(sleeps) == 29
+        previous = base
+        for sleep in sleeps:
+            assert base <= sleep <= min(maximum, 3 * previous)
+            previous = sleep
+
+    def test_decorrelated_grows_from_previous_wait(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that each decorrelated wait builds on the wait before it."""
+        # Always draw the upper bound, so waits triple until capped
+        monkeypatch.setattr("mamba_agents.errors.retry.random.uniform", lambda low, high: high)
+        sleeps: list[float] = []
+        retrying = Retrying(
+            wait=_create_wait("decorrelated", 0.5, 20.0),
+            stop=stop_after_attempt(6),
+            sleep=sleeps.append,
+            reraise=True,
+        )
+
+        with pytest.raises(ConnectionError):
+            retrying(_raise_connection_error)
+
+        assert sleeps == [1.5, 4.5, 13.5, 20.0, 20.0]
+
+
+class TestRetryContextCircuitBreaker:
+    """Tests for the circuit breaker in RetryContext."""
+
+    async def test_opens_after_threshold_transient_failures(self) -> None:
+        """Test that the circuit opens after threshold transient failures."""
+        context = RetryContext("model", _config(circuit_breaker_threshold=3))
+
+        for _ in range(3):
+            with pytest.raises(ConnectionError):
+                await context.execute(_connection_error)
+
+        assert context.circuit_breaker.state is CircuitState.OPEN
+
+    async def test_open_circuit_fails_fast(self) -> None:
+        """Test that an open circuit rejects calls without running them."""
+        context = RetryContext("model", _config(circuit_breaker_threshold=2))
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                await context.execute(_connection_error)
+
+        calls = 0
+
+        async def counted() -> str:
+            nonlocal calls
+            calls += 1
+            return "ok"
+
+        with pytest.raises(CircuitBreakerOpenError):
+            await context.execute(counted)
+
+        assert calls == 0
+        assert context.attempts == 2
+        assert context.circuit_breaker.stats.rejected_calls == 1
+
+    async def test_half_open_recovery(self) -> None:
+        """Test that the circuit closes again after successful trial calls."""
+        context = RetryContext(
+            "model", _config(circuit_breaker_threshold=2, circuit_breaker_timeout=0.05)
+        )
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                await context.execute(_connection_error)
+
+        await asyncio.sleep(0.06)
+        breaker = context.circuit_breaker
+        assert breaker.state is CircuitState.HALF_OPEN
+
+        for _ in range(breaker.config.success_threshold):
+            assert await context.execute(_healthy) == "ok"
+
+        assert breaker.state is CircuitState.CLOSED
+
+    async def test_half_open_failure_reopens(self) -> None:
+        """Test that a transient failure in half-open reopens the circuit."""
+        context = RetryContext(
+            "model", _config(circuit_breaker_threshold=2, circuit_breaker_timeout=0.05)
+        )
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                await context.execute(_connection_error)
+
+        await asyncio.sleep(0.06)
+        with pytest.raises(ConnectionError):
+            await context.execute(_connection_error)
+
+        assert context.circuit_breaker.state is CircuitState.OPEN
+
+    async def test_ignores_non_retryable_errors(self) -> None:
+        """Test that errors which are never retried do not open the circuit."""
+        context = RetryContext("model", _config(circuit_breaker_threshold=3))
+
+        for _ in range(5):
+            with pytest.raises(ValueError):
+                await context.execute(_value_error)
+
+        assert await context.execute(_healthy) == "ok"
+        assert context.circuit_breaker.state is CircuitState.CLOSED
+
+    def test_breaker_configured_from_config(self) -> None:
+        """Test that a context's own breaker uses the config's settings."""
+        context = RetryContext(
+            "model", _config(circuit_breaker_threshold=7, circuit_breaker_timeout=12.0)
+        )
+
+        assert context.circuit_breaker.name == "model"
+        assert context.circuit_breaker.config.failure_threshold == 7
+        assert context.circuit_breaker.config.timeout == 12.0
+
+    async def test_contexts_do_not_share_breakers_by_default(self) -> None:
+        """Test that an open circuit does not affect other contexts."""
+        config = _config(circuit_breaker_threshold=2)
+        tripped = RetryContext("model", config)
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                await tripped.execute(_connection_error)
+
+        assert await RetryContext("model", config).execute(_healthy) == "ok"
+
+    async def test_shared_breaker(self) -> None:
+        """Test that contexts given the same breaker share its state."""
+        config = _config(circuit_breaker_threshold=2)
+        first = RetryContext("model", config)
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                await first.execute(_connection_error)
+
+        second = RetryContext("model", config, circuit_breaker=first.circuit_breaker)
+
+        with pytest.raises(CircuitBreakerOpenError):
+            await second.execute(_healthy)
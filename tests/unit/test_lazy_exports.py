@@ -0,0 +1,115 @@
+"""Tests for lazy package-level exports."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import mamba_agents
+
+
+class TestLazyExports:
+    """Tests for PEP 562 lazy re-exports on the top-level package."""
+
+    def test_all_exports_resolve(self) -> None:
+        """Test that every name in __all__ can be resolved."""
+        for name in mamba_agents.__all__:
+            assert getattr(mamba_agents, name) is not None
+
+    def test_resolved_export_is_cached(self) -> None:
+        """Test that a resolved export is stored in the package namespace."""
+        agent_cls = mamba_agents.Agent
+        assert vars(mamba_agents)["Agent"] is agent_cls
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Test that unknown names raise AttributeError."""
+        with pytest.raises(AttributeError, match="has no attribute 'Missing'"):
+            mamba_agents.Missing  # noqa: B018
+
+    def test_dir_lists_lazy_exports(self) -> None:
+        """Test that dir() includes exports that were not yet resolved."""
+        names = dir(mamba_agents)
+        for name in mamba_agents.__all__:
+            assert name in names
+
+    def test_import_does_not_load_heavy_dependencies(self) -> None:
+        """Test that importing the package does not import pydantic-ai or tiktoken."""
+        code = (
+            "import sys, mamba_agents; "
+            "print('pydantic_ai' in sys.modules, 'tiktoken' in sys.modules)"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        assert output == "False False"
+
+    def test_agent_module_defers_pydantic_ai(self) -> None:
+        """Test that importing the agent module does not import pydantic-ai."""
+        code = "import sys, mamba_agents.agent.core; print('pydantic_ai' in sys.modules)"
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        assert output == "False"
+
+    def test_agent_config_import_is_lightweight(self) -> None:
+        """Test that importing AgentConfig does not load the agent runtime."""
+        code = (
+            "import sys; from mamba_agents.agent import AgentConfig; "
+            "print(any(m in sys.modules for m in "
+            "('mamba_agents.agent.core', 'tiktoken', 'jinja2')))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        assert output == "False"
+
+    def test_subpackage_imports_defer_heavy_modules(self) -> None:
+        """Test that config and compaction packages load their heavy parts lazily."""
+        code = (
+            "import sys; import mamba_agents.config, mamba_agents.context.compaction; "
+            "print(any(m in sys.modules for m in "
+            "('pydantic_settings', 'tiktoken', 'mamba_agents.context.compaction.hybrid')))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        assert output == "False"
+
+    def test_subpackage_lazy_exports_resolve(self) -> None:
+        """Test that lazily exported config and compaction names resolve."""
+        from mamba_agents import config
+        from mamba_agents.context import compaction
+
+        assert config.AgentSettings.__name__ == "AgentSettings"
+        for name in compaction.__all__:
+            assert getattr(compaction, name).__name__ == name
+
+    def test_context_manager_imports_strategies_on_use(self) -> None:
+        """Test that only the configured compaction strategy module is imported."""
+        code = (
+            "import sys; from mamba_agents.context.manager import ContextManager; "
+            "loaded = lambda: sorted(m.rsplit('.', 1)[1] for m in sys.modules "
+            "if m.startswith('mamba_agents.context.compaction.') and not m.endswith('.base')); "
+            "before = loaded(); ContextManager(); print(before, loaded())"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        assert output == "[] ['sliding_window']"
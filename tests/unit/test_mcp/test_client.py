@@ -14,7 +14,7 @@ class TestMCPClientManager:
     def test_init_empty(self) -> None:
         """Test initialization with no configs."""
         manager = MCPClientManager()
-        assert manager.configs == []
+        assert len(manager.configs) == 0
 
     def test_init_with_configs(self) -> None:
         """Test initialization with configs."""
@@ -34,17 +34,29 @@ class TestMCPClientManager:
         assert len(manager.configs) == 1
         assert manager.configs[0].name == "new-server"
 
-    def test_configs_returns_copy(self) -> None:
-        """Test that configs property returns a copy."""
+    def test_configs_returns_snapshot(self) -> None:
+        """Test that configs property returns a read-only snapshot."""
         configs = [MCPServerConfig(name="server1", command="cmd")]
         manager = MCPClientManager(configs)
 
-        # Modifying returned list shouldn't affect internal state
+        # Neither the returned snapshot nor the caller's list changes internal state
         returned_configs = manager.configs
-        returned_configs.append(MCPServerConfig(name="server2", command="cmd2"))
+        assert isinstance(returned_configs, tuple)
+        configs.append(MCPServerConfig(name="server2", command="cmd2"))
 
+        assert manager.configs is returned_configs
         assert len(manager.configs) == 1
 
+    def test_configs_snapshot_refreshed_after_add(self) -> None:
+        """Test that adding a server is reflected in the next configs snapshot."""
+        manager = MCPClientManager([MCPServerConfig(name="server1", command="cmd")])
+        before = manager.configs
+
+        manager.add_server(MCPServerConfig(name="server2", command="cmd2"))
+
+        assert len(before) == 1
+        assert [config.name for config in manager.configs] == ["server1", "server2"]
+
 
 class TestMCPClientManagerAsToolsets:
     """Tests for as_toolsets() method."""
@@ -116,6 +128,18 @@ class TestMCPClientManagerAsToolsets:
         toolsets = manager.as_toolsets()
         assert toolsets == []
 
+    def test_as_toolsets_reuses_built_servers(self) -> None:
+        """Test that repeated calls return the servers built the first time."""
+        manager = MCPClientManager([MCPServerConfig(name="s1", command="cmd1")])
+        first = manager.as_toolsets()
+
+        manager.add_server(MCPServerConfig(name="s2", transport="sse", url="http://x/sse"))
+        second = manager.as_toolsets()
+
+        assert second[0] is first[0]
+        assert len(second) == 2
+        assert isinstance(second[1], MCPServerSSE)
+
     def test_as_toolsets_stdio_missing_command(self) -> None:
         """Test that ValueError is raised when stdio config missing command."""
         configs = [MCPServerConfig(name="broken", transport="stdio")]